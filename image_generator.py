@@ -1,10 +1,13 @@
-import requests
-from PIL import Image
-from io import BytesIO
 import os
+import sys
 from dotenv import load_dotenv
 import base64
 
+# Share the package's tools (run from the repo root like the rest of the project)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "linkedin_automation"))
+from tools.hf_image import generate_image_bytes_hf, get_hf_client
+from tools.image_output import persist_image
+
 # Load environment variables
 load_dotenv()
 HF_API_KEY = os.getenv("HF_TOKEN")
@@ -16,7 +19,9 @@ def generate_image_hf(prompt, model_name="black-forest-labs/FLUX.1-schnell", out
     Args:
         prompt (str): Text prompt for image generation
         model_name (str): Hugging Face model to use
-        output_path (str): Path to save the generated image
+        output_path (str): Path to save the generated image (extension follows the real format)
+    
+    Returns the saved image path, or None on failure.
     
     Popular models:
     - "black-forest-labs/FLUX.1-schnell" (fast, free tier friendly)
@@ -25,47 +30,15 @@ def generate_image_hf(prompt, model_name="black-forest-labs/FLUX.1-schnell", out
     - "stabilityai/stable-diffusion-xl-base-1.0" (classic SDXL)
     """
     
-    # Hugging Face Inference API URL
-    API_URL = f"https://api-inference.huggingface.co/models/{model_name}"
-    
-    headers = {
-        "Authorization": f"Bearer {HF_API_KEY}",
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
-        "inputs": prompt,
-        "parameters": {
-            "guidance_scale": 7.5,  # How closely to follow the prompt
-            "num_inference_steps": 20,  # Quality vs speed tradeoff
-            "width": 1024,
-            "height": 1024
-        }
-    }
-    
     try:
         print(f"Generating image with prompt: '{prompt}'")
         print(f"Using model: {model_name}")
         
-        response = requests.post(API_URL, headers=headers, json=payload)
+        # The response content is the image bytes; saved without re-encoding
+        saved_path = persist_image(generate_image_bytes_hf(prompt, model_name), output_path)
+        print(f"Image saved successfully to: {saved_path}")
         
-        if response.status_code == 200:
-            # The response content is the image bytes
-            image = Image.open(BytesIO(response.content))
-            
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
-            # Save the image
-            image.save(output_path)
-            print(f"Image saved successfully to: {output_path}")
-            
-            return image
-            
-        else:
-            print(f"Error: {response.status_code}")
-            print(f"Response: {response.text}")
-            return None
+        return saved_path
             
     except Exception as e:
         print(f"An error occurred: {str(e)}")
@@ -149,4 +122,5 @@ if __name__ == "__main__":
         # Optionally display the image
         # image.show()
     else:
-        print("Image generation failed!")
\ No newline at end of file
+        print("Image generation failed!")
+    print(f"HF client metrics: {get_hf_client().metrics()}")
\ No newline at end of file
@@ -0,0 +1 @@
+"""Local benchmarks; run as python -m benchmarks.<name> from src/linkedin_automation"""
@@ -0,0 +1,109 @@
+"""
+Cold-start benchmark for the CLI entry points.
+
+Starts a fresh interpreter per sample, so nothing is cached in sys.modules,
+and reports the median wall time plus the heaviest imports per entry point.
+Run from src/linkedin_automation:
+
+    python -m benchmarks.import_benchmark --runs 5
+    python -m benchmarks.import_benchmark --save-baseline imports.json
+    python -m benchmarks.import_benchmark --baseline imports.json --tolerance 0.3
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name -> interpreter arguments
+ENTRY_POINTS = {
+    "main --help": ["main.py", "--help"],
+    "import crew_new": ["-c", "import crew_new"],
+    "import crew": ["-c", "import crew"],
+    "import tools.linkedin_poster": ["-c", "import tools.linkedin_poster"],
+    "import tools.linkedin_poster_tool": ["-c", "import tools.linkedin_poster_tool"],
+}
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+def sample(args):
+    """(wall seconds, {top-level module: cumulative seconds}, error) of one cold start"""
+    started = time.monotonic()
+    proc = subprocess.run([sys.executable, "-X", "importtime", *args], cwd=PACKAGE_DIR,
+                          capture_output=True, text=True)
+    wall = time.monotonic() - started
+    heaviest = {}
+    for match in IMPORTTIME_LINE.finditer(proc.stderr):
+        cumulative, indent, module = int(match.group(2)), match.group(3), match.group(4)
+        # Top-level, non-stdlib imports: the ones an entry point can defer
+        root = module.split(".")[0]
+        if len(indent) == 1 and root not in sys.stdlib_module_names and not root.startswith("_"):
+            heaviest[module] = cumulative / 1e6
+    error = None
+    if proc.returncode != 0:
+        error = (proc.stderr.strip().splitlines() or ["exit code %d" % proc.returncode])[-1]
+    return wall, heaviest, error
+
+def measure(runs):
+    """{entry point: {"median", "min", "top", "error"}}"""
+    results = {}
+    for name, args in ENTRY_POINTS.items():
+        walls, heaviest, error = [], {}, None
+        for _ in range(runs):
+            wall, modules, error = sample(args)
+            walls.append(wall)
+            heaviest = modules
+        top = sorted(heaviest.items(), key=lambda item: item[1], reverse=True)[:5]
+        results[name] = {"median": round(statistics.median(walls), 3), "min": round(min(walls), 3),
+                         "top": [[module, round(seconds, 3)] for module, seconds in top], "error": error}
+    return results
+
+def print_results(results):
+    print("\n🚀 Cold start (fresh interpreter per sample)")
+    print(f"{'entry point':<36}{'median s':>10}{'min s':>9}  heaviest imports")
+    for name, result in results.items():
+        top = ", ".join(f"{module} {seconds:.2f}s" for module, seconds in result["top"][:3])
+        print(f"{name:<36}{result['median']:>10.3f}{result['min']:>9.3f}  {top}")
+        if result["error"]:
+            print(f"{'':<36}⚠️ {result['error']}")
+
+def regressions(results, baseline, tolerance):
+    """Entry points whose median start got slower than baseline by more than tolerance"""
+    slower = []
+    for name, result in results.items():
+        before = baseline.get(name, {}).get("median")
+        if before and result["median"] > before * (1 + tolerance):
+            slower.append(f"{name}: {before:.3f}s → {result['median']:.3f}s")
+    return slower
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold-start import time of the entry points")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--save-baseline", metavar="FILE")
+    parser.add_argument("--baseline", metavar="FILE", help="Fail when an entry point regresses past --tolerance")
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    args = parser.parse_args(argv)
+
+    results = measure(args.runs)
+    print_results(results)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Baseline saved to {args.save_baseline}")
+    if args.baseline:
+        with open(args.baseline) as f:
+            slower = regressions(results, json.load(f), args.tolerance)
+        if slower:
+            print("❌ Cold-start regressions:\n  " + "\n  ".join(slower))
+            return 1
+        print("✅ No cold-start regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
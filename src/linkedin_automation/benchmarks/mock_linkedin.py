@@ -0,0 +1,181 @@
+import json
+import time
+import threading
+from urllib.parse import parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Render delays in milliseconds for each stand-in step
+DEFAULT_DELAYS = {"login": 300, "feed": 400, "composer": 250, "media": 200, "publish": 500}
+
+# Markup per variant. "primary" matches the first selector of every list in
+# linkedin_poster_tool; "fallback" only matches later candidates, the way a
+# LinkedIn UI change would.
+VARIANTS = {
+    "primary": {
+        "start_post": '<button class="share-box-feed-entry__trigger"><span>Start a post</span></button>',
+        "editor": '<div class="ql-editor" contenteditable="true" role="textbox"></div>',
+        "media_button": '<button aria-label="Add media" id="media-button">Media</button>',
+        "next_button": '<button id="media-next"><span>Next</span></button>',
+        "post_button": '<button class="share-actions__primary-action" id="post-button"><span>Post</span></button>',
+    },
+    "fallback": {
+        "start_post": '<div class="share-box-feed-entry__trigger" tabindex="0">Start a post</div>',
+        "editor": '<div class="editor-content" contenteditable="true"></div>',
+        "media_button": '<button aria-label="Add a photo" id="media-button">Photo</button>',
+        "next_button": '<button class="share-box-footer__primary-btn" id="media-next">Continue</button>',
+        "post_button": '<button class="artdeco-button--primary" id="post-button">Post</button>',
+    },
+}
+
+LOGIN_PAGE = """<!doctype html>
+<html><head><title>LinkedIn Login</title></head><body>
+<form method="post" action="/login">
+  <input id="username" name="session_key" type="text">
+  <input id="password" name="session_password" type="password">
+  <button type="submit">Sign in</button>
+</form>
+</body></html>"""
+
+FEED_PAGE = """<!doctype html>
+<html><head><title>Feed | LinkedIn</title></head><body>
+<nav><button class="global-nav__primary-link">Home</button></nav>
+<main id="feed"></main>
+<div id="toasts"></div>
+<script>
+const markup = %(markup)s;
+const delays = %(delays)s;
+function later(step, fn) { setTimeout(fn, delays[step] || 0); }
+function add(parent, html) {
+  const holder = document.createElement('div');
+  holder.innerHTML = html;
+  const node = holder.firstElementChild;
+  parent.appendChild(node);
+  return node;
+}
+function openComposer() {
+  later('composer', () => {
+    const dialog = document.createElement('div');
+    dialog.setAttribute('role', 'dialog');
+    dialog.id = 'composer';
+    document.body.appendChild(dialog);
+    const editor = add(dialog, markup.editor);
+    const media = add(dialog, markup.media_button);
+    media.addEventListener('click', () => later('media', () => {
+      const input = add(dialog, '<input type="file" accept="image/*">');
+      input.addEventListener('change', () => later('media', () => {
+        const next = add(dialog, markup.next_button);
+        next.addEventListener('click', () => { input.remove(); next.remove(); });
+      }));
+    }));
+    const post = add(dialog, markup.post_button);
+    post.addEventListener('click', () => {
+      fetch('/api/posts', {method: 'POST', body: editor.innerText});
+      later('publish', () => {
+        dialog.remove();
+        add(document.getElementById('toasts'),
+            '<div class="artdeco-toast-item">Post successful. View post</div>');
+      });
+    });
+  });
+}
+later('feed', () => {
+  const trigger = add(document.getElementById('feed'), markup.start_post);
+  trigger.addEventListener('click', openComposer);
+});
+</script>
+</body></html>"""
+
+class MockLinkedIn:
+    """
+    Local stand-in for the LinkedIn pages the poster touches: login form,
+    feed with share box, composer dialog, media editor and Post button.
+    Render delays and selector variant are set per instance.
+    """
+
+    def __init__(self, delays=None, variant="primary", host="127.0.0.1", port=0):
+        self.delays = {**DEFAULT_DELAYS, **(delays or {})}
+        self.variant = variant
+        self.posts = []
+        self.logins = 0
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, status, body=b"", content_type="text/html", headers=()):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _logged_in(self):
+                return "li_at=" in self.headers.get("Cookie", "")
+
+            def do_GET(self):
+                path = self.path.split("?")[0]
+                if path in ("/", "/feed", "/feed/"):
+                    if not self._logged_in():
+                        return self._send(302, headers=[("Location", "/login")])
+                    page = FEED_PAGE % {"markup": json.dumps(VARIANTS[mock.variant]), "delays": json.dumps(mock.delays)}
+                    return self._send(200, page.encode())
+                if path == "/login":
+                    return self._send(200, LOGIN_PAGE.encode())
+                self._send(404, b"not found", "text/plain")
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if self.path == "/login":
+                    form = parse_qs(body.decode())
+                    if not form.get("session_key") or not form.get("session_password"):
+                        return self._send(302, headers=[("Location", "/login")])
+                    time.sleep(mock.delays["login"] / 1000)
+                    mock.logins += 1
+                    return self._send(303, headers=[
+                        ("Location", "/feed/"),
+                        ("Set-Cookie", "li_at=mock-token; Path=/; Max-Age=86400"),
+                        ("Set-Cookie", "JSESSIONID=mock-session; Path=/; Max-Age=86400"),
+                    ])
+                if self.path == "/api/posts":
+                    mock.posts.append(body.decode())
+                    return self._send(201, b"{}", "application/json")
+                self._send(404, b"not found", "text/plain")
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, name="mock-linkedin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+if __name__ == "__main__":
+    # Serve the stand-in for manual poking: python -m benchmarks.mock_linkedin
+    with MockLinkedIn(port=8765) as mock:
+        print(f"🧪 Mock LinkedIn on {mock.base_url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,72 @@
+"""
+Per-run setup cost of the crews, with LLM clients and tools rebuilt every run
+versus shared through one Pipeline.
+
+Builds the content, image and posting crews the way the pipeline does, with
+no kickoff and no API calls, so it only measures YAML parsing and agent, task,
+LLM client and tool construction. Agents and tasks are rebuilt per run in both
+modes; only the clients and tools differ. Run from src/linkedin_automation:
+
+    python -m benchmarks.pipeline_setup_benchmark --runs 10
+"""
+import sys
+import time
+import argparse
+import statistics
+
+STAGES = ("content", "image", "posting")
+
+def reset_clients():
+    """Forget the shared LLM clients and search tool so the next build makes new ones"""
+    import pipeline_crews
+
+    pipeline_crews._llm_text = pipeline_crews._llm_image = pipeline_crews._search_tool = None
+
+def fresh_setup(runs):
+    """Seconds per run when every run builds new LLM clients and tools (the old behaviour)"""
+    import pipeline_crews
+
+    timings = []
+    for _ in range(runs):
+        started = time.monotonic()
+        reset_clients()
+        for stage in STAGES:
+            pipeline_crews.CREW_CLASSES[stage]().crew()
+        timings.append(time.monotonic() - started)
+    return timings
+
+def shared_setup(runs):
+    """Seconds per run when one Pipeline serves every run"""
+    from crew_new import Pipeline
+
+    # Start from nothing, like a new process; fresh_setup leaves clients built
+    reset_clients()
+    pipeline = Pipeline()
+    timings = []
+    for _ in range(runs):
+        started = time.monotonic()
+        for stage in STAGES:
+            pipeline.crew(stage)
+        timings.append(time.monotonic() - started)
+    return timings, pipeline.report()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare per-run crew setup time, fresh versus shared clients")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    # The first build also pays for imports; keep that out of both series
+    fresh_setup(1)
+    fresh = fresh_setup(args.runs)
+    shared, report = shared_setup(args.runs)
+
+    print(f"\n♻️ Crew setup over {args.runs} runs")
+    print(f"{'mode':<10}{'first s':>10}{'median s':>10}{'total s':>10}")
+    for mode, timings in (("fresh", fresh), ("shared", shared)):
+        print(f"{mode:<10}{timings[0]:>10.3f}{statistics.median(timings):>10.3f}{sum(timings):>10.3f}")
+    print(f"💡 Sharing clients saved {sum(fresh) - sum(shared):.2f}s "
+          f"({report['rebuild_seconds']}s spent rebuilding agents and tasks per kickoff)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
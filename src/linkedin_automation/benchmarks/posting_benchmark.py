@@ -0,0 +1,145 @@
+"""
+End-to-end posting benchmark against the local LinkedIn stand-in.
+
+Runs the real Selenium flow (login, open composer, type, publish, session save)
+several times and reports per-step and total wall time. Run from
+src/linkedin_automation:
+
+    python -m benchmarks.posting_benchmark --runs 5 --variant fallback
+    python -m benchmarks.posting_benchmark --save-baseline bench.json
+    python -m benchmarks.posting_benchmark --baseline bench.json --tolerance 0.2
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+from benchmarks.mock_linkedin import MockLinkedIn, DEFAULT_DELAYS, VARIANTS
+
+STEPS = ("login", "composer_open", "type", "publish", "session_save", "total")
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def run_once(text, workdir, fresh_login, index):
+    """Timings of one full post on a new browser and profile, as {step: seconds}"""
+    # Imported here so LINKEDIN_BASE_URL and friends are set first
+    from tools.driver_pool import create_driver
+    from tools.page_metrics import page_metrics
+    from tools.linkedin_poster import linkedin_login_with_session, publish_post, save_session_data
+
+    session_file = os.path.join(workdir, "session.json")
+    if fresh_login and os.path.exists(session_file):
+        os.remove(session_file)
+
+    timings = {}
+    started = time.monotonic()
+    # A new profile each run, so only the session store can skip the login form
+    driver = create_driver(os.path.join(workdir, f"profile-{index}"))
+    try:
+        step_started = time.monotonic()
+        if not linkedin_login_with_session(driver, "bench@example.com", "bench-password", session_file):
+            raise RuntimeError("login against the stand-in failed")
+        timings["login"] = time.monotonic() - step_started
+
+        result = publish_post(driver, text)
+        if not result.startswith("✅"):
+            raise RuntimeError(result)
+        # publish_post marks each step; the sample holds the time since the previous mark
+        for step in ("composer_open", "type", "publish"):
+            timings[step] = page_metrics.samples[step][-1]["seconds"]
+
+        step_started = time.monotonic()
+        save_session_data(driver, session_file, "bench@example.com")
+        timings["session_save"] = time.monotonic() - step_started
+    finally:
+        driver.quit()
+    timings["total"] = time.monotonic() - started
+    return timings
+
+def summarize(runs):
+    """{step: {"p50", "p95", "mean"}} over all runs"""
+    summary = {}
+    for step in STEPS:
+        values = [run[step] for run in runs if run.get(step) is not None]
+        if values:
+            summary[step] = {"p50": round(percentile(values, 0.5), 3), "p95": round(percentile(values, 0.95), 3),
+                             "mean": round(sum(values) / len(values), 3)}
+    return summary
+
+def print_summary(summary, runs):
+    print(f"\n📊 Posting benchmark ({runs} runs)")
+    print(f"{'step':<15}{'p50 s':>10}{'p95 s':>10}{'mean s':>10}")
+    for step, stats in summary.items():
+        print(f"{step:<15}{stats['p50']:>10.3f}{stats['p95']:>10.3f}{stats['mean']:>10.3f}")
+
+def regressions(summary, baseline, tolerance):
+    """Steps whose p50 got slower than baseline by more than tolerance"""
+    slower = []
+    for step, stats in summary.items():
+        before = baseline.get(step, {}).get("p50")
+        if before and stats["p50"] > before * (1 + tolerance):
+            slower.append(f"{step}: {before:.3f}s → {stats['p50']:.3f}s")
+    return slower
+
+def parse_delays(pairs):
+    delays = {}
+    for pair in pairs or []:
+        step, _, value = pair.partition("=")
+        if step not in DEFAULT_DELAYS or not value:
+            raise SystemExit(f"❌ Error: --delay expects step=ms with step in {', '.join(DEFAULT_DELAYS)}")
+        delays[step] = int(value)
+    return delays
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the LinkedIn posting flow against a local stand-in")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--variant", choices=sorted(VARIANTS), default="primary",
+                        help="Which selector variant the stand-in renders")
+    parser.add_argument("--delay", action="append", metavar="STEP=MS",
+                        help=f"Render delay override, steps: {', '.join(DEFAULT_DELAYS)}")
+    parser.add_argument("--typing-mode", default="bulk", help="LINKEDIN_TYPING_MODE for the run")
+    parser.add_argument("--profile", default="lean", help="LINKEDIN_BROWSER_PROFILE for the run")
+    parser.add_argument("--fresh-login", action="store_true", help="Drop the stored session before every run")
+    parser.add_argument("--text", default="Benchmark post: measuring the posting flow end to end. #benchmark")
+    parser.add_argument("--save-baseline", metavar="FILE", help="Write the summary as a baseline")
+    parser.add_argument("--baseline", metavar="FILE", help="Fail when a step's p50 regresses past --tolerance")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="linkedin-bench-")
+    with MockLinkedIn(delays=parse_delays(args.delay), variant=args.variant) as mock:
+        os.environ.update({
+            "LINKEDIN_BASE_URL": mock.base_url,
+            "LINKEDIN_TYPING_MODE": args.typing_mode,
+            "LINKEDIN_BROWSER_PROFILE": args.profile,
+            "LINKEDIN_SELECTOR_STATS": os.path.join(workdir, "selector_stats.json"),
+        })
+        os.environ.pop("GITHUB_ACTIONS", None)
+        runs = []
+        for index in range(args.runs):
+            timings = run_once(args.text, workdir, args.fresh_login, index)
+            runs.append(timings)
+            print(f"⏱️ Run {index + 1}/{args.runs}: {timings['total']:.2f}s")
+        print(f"🧪 Stand-in saw {mock.logins} form logins and {len(mock.posts)} posts")
+
+    summary = summarize(runs)
+    print_summary(summary, len(runs))
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"💾 Baseline saved to {args.save_baseline}")
+    if args.baseline:
+        with open(args.baseline) as f:
+            slower = regressions(summary, json.load(f), args.tolerance)
+        if slower:
+            print("❌ Latency regressions:\n  " + "\n  ".join(slower))
+            return 1
+        print("✅ No latency regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
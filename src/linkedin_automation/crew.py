@@ -1,31 +1,35 @@
 import os
-import google.generativeai as genai
 from dotenv import load_dotenv
 from crewai import Process
 from crewai.project import CrewBase, agent, task, crew
-from crewai_tools import SerperDevTool
 from crewai import Agent, Crew, Task, Process
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from typing import List
-from ratelimit import limits, sleep_and_retry
 
 
 #from tools.image_generator_tool import image_generator_tool
 from tools.linkedin_poster_tool import linkedin_poster_tool
+from tools.search_tool import SerperSearchTool
+from llm_clients import RateLimitedLLM
 
 load_dotenv()
 os.getenv("GEMINI_API_KEY")
 os.getenv("HF_TOKEN")
 
-from crewai import LLM
+# Clients are built on first use, so importing this module stays cheap
+_llm = None
+_search_tool = None
 
-
-llm = LLM(
-    model="gemini/gemini-2.5-flash-lite",
-    temperature=0.7,
-    max_rpm=5,              # Add rate limiting
-    respect_context_window=True  # Prevent token limit issues
-)
+def get_llm():
+    global _llm
+    if _llm is None:
+        _llm = RateLimitedLLM(
+            model="gemini/gemini-2.5-flash-lite",
+            temperature=0.7,
+            max_rpm=5,              # Add rate limiting
+            respect_context_window=True  # Prevent token limit issues
+        )
+    return _llm
 
 # llm_image = LLM(
 #     model="huggingface/black-forest-labs/FLUX.1-schnell",
@@ -34,7 +38,11 @@ llm = LLM(
 # )
  
 # Tools
-search_tool = SerperDevTool()
+def get_search_tool():
+    global _search_tool
+    if _search_tool is None:
+        _search_tool = SerperSearchTool()
+    return _search_tool
 
 @CrewBase
 class LinkedinAutomationCrew:
@@ -50,8 +58,8 @@ class LinkedinAutomationCrew:
         return Agent(
             config=self.agents_config['trend_researcher'], # type: ignore[index]
             verbose=True,
-            llm=llm,
-            tools=[search_tool]
+            llm=get_llm(),
+            tools=[get_search_tool()]
 
         )
     
@@ -60,14 +68,14 @@ class LinkedinAutomationCrew:
         return Agent(
             config=self.agents_config['topic_researcher'], # type: ignore[index]
             verbose=True,
-            llm=llm,
-            tools=[search_tool]
+            llm=get_llm(),
+            tools=[get_search_tool()]
         )
     @agent
     def summarizer(self) -> Agent:
         return Agent(
             config=self.agents_config['summarizer'], # type: ignore[index],
-            llm=llm,
+            llm=get_llm(),
             verbose=True
         )
     
@@ -86,7 +94,7 @@ class LinkedinAutomationCrew:
         return Agent(
             config=self.agents_config['linkedin_poster'], # type: ignore[index]
             verbose=True,
-            llm=llm,
+            llm=get_llm(),
             tools=[linkedin_poster_tool]
         )
     
@@ -128,7 +136,7 @@ class LinkedinAutomationCrew:
         tasks=self.tasks,
         process=Process.sequential,
         tools={
-            "serper": search_tool,
+            "serper": get_search_tool(),
             #"image_generator_tool": image_generator_tool,
             "linkedin_poster_tool": linkedin_poster_tool
         })
@@ -1,219 +1,194 @@
-import os
+import sys
 import time
-import google.generativeai as genai
+import argparse
 from dotenv import load_dotenv
-from crewai import Process
-from crewai.project import CrewBase, agent, task, crew
-from crewai_tools import SerperDevTool
-from crewai import Agent, Crew, Task, Process, LLM
-from crewai.agents.agent_builder.base_agent import BaseAgent
-from typing import List
 
-from tools.image_generator_tool import image_generator_tool
-from tools.linkedin_poster_tool import linkedin_poster_tool
+# Light imports only: crewai, the Gemini SDKs and Selenium load inside the
+# stages that need them (see pipeline_crews.py)
+from llm_cache import llm_cache_report
+from tools.rate_limiter import limiter_report
+from tools.image_cache import image_cache_report
+from tools.tracing import span, traced, print_trace_summary
+from run_checkpoints import RunCheckpoints, latest_run_id, run_exists
 
 # Load environment variables
 load_dotenv()
-text_key = os.getenv("GEMINI_API_KEY_TEXT")
-image_key = os.getenv("GEMINI_API_KEY_IMAGE")
 
-# Setup LLMs
-os.environ["GEMINI_API_KEY"] = text_key
-print("gemini key-->", os.getenv("GEMINI_API_KEY"))
-
-llm_text = LLM(
-    model="gemini/gemini-2.5-flash",
-    temperature=0.7,
-    max_rpm=5,
-    respect_context_window=True
-)
-
-# Tools
-search_tool = SerperDevTool()
-
-# Content Creation Crew
-@CrewBase
-class ContentCreationCrew:
-    agents: List[BaseAgent]
-    tasks: List[Task]
-
-    agents_config = "config/agents_content_creation.yaml"
-    tasks_config = "config/tasks_content_creation.yaml"
-    
-    @agent
-    def trend_researcher(self) -> Agent:
-        return Agent(
-            config=self.agents_config['trend_researcher'],
-            verbose=True,
-            llm=llm_text,
-            tools=[search_tool]
-        )
-    
-    @agent
-    def topic_researcher(self) -> Agent:
-        return Agent(
-            config=self.agents_config['topic_researcher'],
-            verbose=True,
-            llm=llm_text,
-            tools=[search_tool]
-        )
-    
-    @agent
-    def summarizer(self) -> Agent:
-        return Agent(
-            config=self.agents_config['summarizer'],
-            llm=llm_text,
-            verbose=True
-        )
-    
-    @task
-    def find_trends_task(self) -> Task:
-        return Task(
-            config=self.tasks_config['find_trends_task']
-        )
-    
-    @task
-    def research_topic_task(self) -> Task:
-        return Task(
-            config=self.tasks_config['research_topic_task']
-        )
-    
-    @task
-    def summarize_post_task(self) -> Task:
-        return Task(
-            config=self.tasks_config['summarize_post_task']
-        )
-    
-    @crew
-    def crew(self) -> Crew:
-        return Crew(
-            agents=self.agents,
-            tasks=self.tasks,
-            process=Process.sequential,
-            llm=llm_text
-        )
-
-# Image Generation Crew
-@CrewBase
-class ImageGenerationCrew:
-    agents: List[BaseAgent]
-    tasks: List[Task]
-
-    agents_config = "config/agents_image_generation.yaml"
-    tasks_config = "config/tasks_image_generation.yaml"
-    
-    @agent
-    def image_generator(self) -> Agent:
-        # Switch to image API key
-        os.environ["GEMINI_API_KEY"] = image_key
-        print("gemini key-->", os.getenv("GEMINI_API_KEY"))
-
-        llm_image = LLM(
-            model="gemini/gemini-2.5-flash-image-preview",
-            max_rpm=5,
-            respect_context_window=True
-        )
-        
-        return Agent(
-            config=self.agents_config['image_generator'],
-            verbose=True,
-            tools=[image_generator_tool],
-            llm=llm_image
-        )
-    
-    @task
-    def generate_image_task(self) -> Task:
-        return Task(
-            config=self.tasks_config['generate_image_task']
-        )
-    
-    @crew
-    def crew(self) -> Crew:
-        return Crew(
-            agents=self.agents,
-            tasks=self.tasks,
-            process=Process.sequential
-        )
-
-# LinkedIn Posting Crew
-@CrewBase
-class LinkedInPostingCrew:
-    agents: List[BaseAgent]
-    tasks: List[Task]
-
-    agents_config = "config/agents_linkedin_posting.yaml"
-    tasks_config = "config/tasks_linkedin_posting.yaml"
-    
-    @agent
-    def linkedin_poster(self) -> Agent:
-        # Switch back to text API key
-        os.environ["GEMINI_API_KEY"] = text_key
-        print("gemini key-->", os.getenv("GEMINI_API_KEY"))
-        return Agent(
-            config=self.agents_config['linkedin_poster'],
-            verbose=True,
-            llm=llm_text,
-            tools=[linkedin_poster_tool]
-        )
-    
-    @task
-    def post_on_linkedin_task(self) -> Task:
-        return Task(
-            config=self.tasks_config['post_on_linkedin_task']
-        )
-    
-    @crew
-    def crew(self) -> Crew:
-        return Crew(
-            agents=self.agents,
-            tasks=self.tasks,
-            process=Process.sequential,
-            llm=llm_text
-        )
+class Pipeline:
+    """
+    Long-lived holder of what the crews share across kickoffs: the LLM clients,
+    the search tool and their rate limiters and caches (see pipeline_crews.py).
+    Agents, tasks and the Crew itself are rebuilt for every kickoff, because
+    crewai keeps per-run state on them (guardrail retry counts, task outputs,
+    the crew's tool-result cache) that must not carry over to the next post.
+    """
+
+    def __init__(self):
+        self.setup_seconds = {}
+        self.rebuild_seconds = {}
+        self.kickoffs = {}
+
+    def crew(self, name):
+        """A fresh crew for a stage ("content", "image" or "posting") on the shared clients"""
+        from pipeline_crews import CREW_CLASSES
+        started = time.monotonic()
+        crew = CREW_CLASSES[name]().crew()
+        elapsed = time.monotonic() - started
+        if name in self.setup_seconds:
+            self.rebuild_seconds[name] = self.rebuild_seconds.get(name, 0.0) + elapsed
+        else:
+            # The first build also pays for the shared clients and tools
+            self.setup_seconds[name] = elapsed
+        self.kickoffs[name] = self.kickoffs.get(name, 0) + 1
+        return crew
+
+    def report(self):
+        """Time of the first builds (shared clients included) and of the per-kickoff rebuilds"""
+        return {
+            "setup_seconds": round(sum(self.setup_seconds.values()), 3),
+            "rebuild_seconds": round(sum(self.rebuild_seconds.values()), 3),
+            "kickoffs": sum(self.kickoffs.values()),
+        }
+
+_pipeline = None
+
+def get_pipeline():
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = Pipeline()
+    return _pipeline
 
 # Main execution functions
-def run_content_creation():
+def run_content_creation(pipeline=None):
     """Run content creation crew"""
     print("Starting content creation...")
-    content_crew = ContentCreationCrew().crew()
-    result = content_crew.kickoff()
+    from topic_history import get_topic_history
+    content_crew = (pipeline or get_pipeline()).crew("content")
+    recent_topics = "; ".join(get_topic_history().recent_headlines()) or "none yet"
+    with span("crew.content_creation"):
+        result = content_crew.kickoff(inputs={"recent_topics": recent_topics})
     print("Content creation completed!")
     return result
 
-def run_image_generation(content_data):
+def run_image_generation(content_data, pipeline=None):
     """Run image generation crew"""
-    print("Starting image generation, time.sleep implemented")
-    time.sleep(70)  # Delay between crews
-    image_crew = ImageGenerationCrew().crew()
-    result = image_crew.kickoff(inputs={"content": content_data})
+    print("Starting image generation...")
+    image_crew = (pipeline or get_pipeline()).crew("image")
+    with span("crew.image_generation"):
+        result = image_crew.kickoff(inputs={"content": content_data})
     print("Image generation completed!")
     return result
 
-def run_linkedin_posting(content_data, image_data):
+def run_linkedin_posting(content_data, image_data, pipeline=None):
     """Run LinkedIn posting crew"""
     print("Starting LinkedIn posting...")
-    time.sleep(10)  # Delay between crews
-    posting_crew = LinkedInPostingCrew().crew()
-    result = posting_crew.kickoff(inputs={
-        "content": content_data,
-        "image": image_data
-    })
+    posting_crew = (pipeline or get_pipeline()).crew("posting")
+    with span("crew.linkedin_posting"):
+        result = posting_crew.kickoff(inputs={
+            "content": content_data,
+            "image": image_data
+        })
     print("LinkedIn posting completed!")
     return result
 
-def main():
-    """Main execution pipeline"""
+@traced("pipeline.run")
+def main(resume=None, pipeline=None):
+    """
+    Main execution pipeline. Every stage's output is checkpointed under
+    runs/<run_id>/; with resume, stages whose checkpoint is still valid are skipped.
+    Returns (posted, result).
+    """
+    checkpoints = RunCheckpoints(resume)
+    print(f"🗂️ Run {checkpoints.run_id} (resume with --resume {checkpoints.run_id})")
+    content = checkpoints.load("content")
+    image = checkpoints.load("image")
+    posting = checkpoints.load("posting")
+    if posting:
+        print(f"✅ Run {checkpoints.run_id} already posted: {posting['result']}")
+        return True, posting["result"]
+    
+    # Launch and log in Chrome while crewai loads and the LLM stages run
+    from tools.linkedin_poster import start_browser_warmup, publish_log
+    start_browser_warmup()
+    
     # Step 1: Create content
-    content_result = run_content_creation()
+    if content:
+        print("⏭️ Reusing checkpointed content")
+    else:
+        content_result = run_content_creation(pipeline)
+        content = {"text": content_result.raw, "trend_summary": content_result.tasks_output[0].raw}
+        checkpoints.save("content", content)
+        # An image made for other content no longer applies
+        image = None
     
     # Step 2: Generate image
-    image_result = run_image_generation(content_result.raw)
+    if image:
+        print(f"⏭️ Reusing checkpointed image {image['image_path']}")
+    else:
+        image = checkpoints.save_image(run_image_generation(content["text"], pipeline).raw)
     
     # Step 3: Post to LinkedIn
-    final_result = run_linkedin_posting(content_result.raw, image_result.raw)
-    
-    print("Pipeline completed successfully!")
-    return final_result
+    # Success comes from what the tool returned, not from the agent's wording of it
+    attempts_before = len(publish_log)
+    # The path the checkpoint verified, not the image agent's prose around it
+    image_input = image["image_path"] or "none, post the text without an image"
+    final_result = run_linkedin_posting(content["text"], image_input, pipeline).raw
+    attempts = publish_log[attempts_before:]
+    ok = any(attempt["ok"] for attempt in attempts)
+    tool_result = attempts[-1]["result"] if attempts else "❌ Error: The posting agent never called the LinkedIn poster tool."
+    checkpoints.save("posting", {"result": final_result, "tool_result": tool_result, "ok": ok})
+    
+    # Remember the topic so future runs steer away from it
+    if ok:
+        from topic_history import get_topic_history
+        get_topic_history().record(content["trend_summary"], content["text"])
+    
+    print("Pipeline completed successfully!" if ok else f"❌ Pipeline failed: {tool_result}")
+    for name, stats in limiter_report().items():
+        print(f"⏱️ Rate limiter {name}: {stats['calls']} calls, waited {stats['waited']}s")
+    cache_stats = llm_cache_report()
+    if cache_stats:
+        print(f"🗃️ LLM cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses ({cache_stats['hit_rate']:.0%})")
+    image_stats = image_cache_report()
+    if image_stats:
+        print(f"🖼️ Image cache: {image_stats['hits']} hits / {image_stats['misses']} misses")
+    if not ok:
+        print(f"↩️ Retry without regenerating: python crew_new.py --resume {checkpoints.run_id}")
+    return ok, final_result
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Create, illustrate and publish a LinkedIn post")
+    parser.add_argument("--resume", nargs="?", const="latest", metavar="RUN_ID",
+                        help="Continue a run, skipping stages with a valid checkpoint (no ID = latest run)")
+    parser.add_argument("--count", type=int, default=1,
+                        help="Create and publish this many posts in one process, reusing the LLM clients and tools")
+    return parser.parse_args()
 
 if __name__ == "__main__":
-    result = main()
\ No newline at end of file
+    args = parse_args()
+    resume = args.resume
+    if resume == "latest":
+        resume = latest_run_id()
+        if resume is None:
+            sys.exit("❌ Error: No run to resume")
+    elif resume and not run_exists(resume):
+        # A fresh run here would post again under a mistyped ID
+        sys.exit(f"❌ Error: No run {resume} to resume")
+    if resume and args.count != 1:
+        sys.exit("❌ Error: --resume continues a single run; drop --count")
+    pipeline = get_pipeline()
+    failed = 0
+    try:
+        for index in range(args.count):
+            if args.count > 1:
+                print(f"📝 Post {index + 1}/{args.count}")
+            posted, result = main(resume, pipeline)
+            failed += not posted
+    finally:
+        reuse = pipeline.report()
+        if reuse["kickoffs"]:
+            print(f"♻️ Crew setup: {reuse['setup_seconds']}s first build, {reuse['rebuild_seconds']}s "
+                  f"rebuilding over {reuse['kickoffs']} kickoffs")
+        print_trace_summary()
+    # Non-zero so scheduled runs can tell a failed post
+    sys.exit(1 if failed else 0)
\ No newline at end of file
@@ -0,0 +1,56 @@
+import os
+import json
+import hashlib
+from tools.disk_cache import DiskCache
+
+CACHE_MODES = ("read_through", "record_only", "off")
+
+# Parameters that change what the model returns; part of the cache key
+KEY_PARAMS = ("temperature", "top_p", "n", "stop", "max_tokens", "max_completion_tokens",
+              "presence_penalty", "frequency_penalty", "seed", "response_format", "reasoning_effort")
+
+def cache_mode():
+    """LLM_CACHE_MODE: read_through (default), record_only or off"""
+    mode = os.getenv("LLM_CACHE_MODE", "read_through").lower()
+    return mode if mode in CACHE_MODES else "read_through"
+
+def cache_key(model, params, messages):
+    """sha256 over the model, generation parameters and rendered prompt"""
+    payload = json.dumps({"model": model, "params": params, "messages": messages},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+_cache = None
+
+def get_llm_cache():
+    """Process-wide response cache under LLM_CACHE_DIR"""
+    global _cache
+    if _cache is None:
+        _cache = DiskCache(
+            os.getenv("LLM_CACHE_DIR", ".cache/llm"),
+            max_bytes=int(os.getenv("LLM_CACHE_MAX_MB", "64")) * 1024 * 1024,
+            default_ttl=float(os.getenv("LLM_CACHE_TTL_HOURS", "12")) * 3600,
+        )
+    return _cache
+
+def cached_completion(model, params, messages, compute):
+    """Return compute()'s text, served from / recorded into the cache according to cache_mode()"""
+    mode = cache_mode()
+    if mode == "off":
+        return compute()
+    cache = get_llm_cache()
+    key = cache_key(model, params, messages)
+    if mode == "read_through":
+        cached = cache.get(key)
+        if cached is not None:
+            return json.loads(cached)["response"]
+    response = compute()
+    # Only plain text answers are replayable; tool-call objects are not.
+    # An empty answer is retried by crewai with the same messages, so it must not stick
+    if isinstance(response, str) and response.strip():
+        cache.put(key, json.dumps({"model": model, "response": response}).encode(), ext="json")
+    return response
+
+def llm_cache_report():
+    """Hit/miss counters of the response cache, or None when it was never used"""
+    return _cache.stats() if _cache else None
@@ -0,0 +1,32 @@
+import os
+from crewai import LLM
+from llm_cache import cached_completion, KEY_PARAMS
+from tools.rate_limiter import get_rate_limiter, estimate_tokens
+from tools.tracing import span
+
+class RateLimitedLLM(LLM):
+    """
+    crewai LLM whose completions are served from the response cache when possible
+    and otherwise go through the shared per-model, per-key rate limiter.
+    """
+
+    def _key_params(self):
+        params = {name: getattr(self, name, None) for name in KEY_PARAMS}
+        params.update(getattr(self, "additional_params", None) or {})
+        return {name: value for name, value in params.items() if value is not None}
+
+    def _limited_call(self, messages, *args, **kwargs):
+        # Without an explicit key litellm falls back to GEMINI_API_KEY at call time
+        api_key = self.api_key or os.getenv("GEMINI_API_KEY")
+        limiter = get_rate_limiter(self.model, api_key)
+        return limiter.call(super().call, messages, *args, tokens=estimate_tokens(messages), **kwargs)
+
+    def call(self, messages, *args, **kwargs):
+        with span("llm.call", model=self.model):
+            # Native function calling runs tools inside the call; never replay those
+            if args or kwargs.get("tools") or kwargs.get("available_functions"):
+                return self._limited_call(messages, *args, **kwargs)
+            return cached_completion(
+                self.model, self._key_params(), messages,
+                lambda: self._limited_call(messages, **kwargs)
+            )
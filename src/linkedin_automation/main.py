@@ -5,10 +5,62 @@
 #     result = crew.kickoff()
 #     print(result)
 
-from tools.linkedin_poster_tool import linkedin_poster_tool
+import os
+import sys
+import json
+import argparse
+from tools.tracing import print_trace_summary
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Publish posts to LinkedIn")
+    parser.add_argument("posts_file", nargs="?",
+                        help='JSON list of posts: [{"text": ..., "image_path": ...}, ...]')
+    parser.add_argument("--accounts", nargs="*",
+                        help="Post for these accounts from the registry (no names = every account)")
+    parser.add_argument("--concurrency", type=int, default=None,
+                        help="Accounts posting at once (default LINKEDIN_ACCOUNT_CONCURRENCY or 2)")
+    return parser.parse_args()
 
 if __name__ == "__main__":
+    args = parse_args()
+    
+    if args.accounts is not None:
+        from tools.multi_account import load_accounts, post_for_accounts, print_report
+        if not args.posts_file:
+            sys.exit("--accounts needs a posts file")
+        with open(args.posts_file) as f:
+            posts = json.load(f)
+        reports = post_for_accounts(posts, load_accounts(names=args.accounts or None), args.concurrency)
+        print_report(reports)
+        sys.exit(0 if all(r["ok"] for report in reports for r in report["results"]) else 1)
+    
+    if args.posts_file:
+        # Batch mode: every post in the file goes through one browser session
+        from tools.linkedin_poster import publish_batch, validate_post
+        linkedin_email = os.getenv("LINKEDIN_EMAIL")
+        linkedin_password = os.getenv("LINKEDIN_PASSWORD")
+        if not linkedin_email or not linkedin_password:
+            sys.exit("❌ Error: Please set LINKEDIN_EMAIL and LINKEDIN_PASSWORD in environment.")
+        with open(args.posts_file) as f:
+            posts = json.load(f)
+        # Reject bad input before Chrome is launched
+        if not isinstance(posts, list) or not posts:
+            sys.exit("❌ Error: posts must be a non-empty list of post dicts.")
+        for index, post in enumerate(posts):
+            error = validate_post(post)
+            if error:
+                sys.exit(f"Post {index + 1}: {error}")
+        results = publish_batch(posts, linkedin_email, linkedin_password)
+        for r in results:
+            print(f"Post {r['index'] + 1}: {r['result']} ({r['seconds']}s)")
+        print_trace_summary()
+        sys.exit(0 if all(r["ok"] for r in results) else 1)
+
+    # Selenium loads only once a mode that posts has been chosen; crewai is never needed here
+    from tools.linkedin_poster import post_once
     sample_content = "This is a test post from the LinkedIn automation bot."
     sample_image = None  # Or provide a path/URL if your tool supports images
-    result = linkedin_poster_tool.run({"text": sample_content})
+    result = post_once({"text": sample_content})
     print("LinkedIn Poster Tool Result:", result)
+    print_trace_summary()
+    sys.exit(0 if result.startswith("✅") else 1)
@@ -0,0 +1,197 @@
+import os
+import threading
+from dotenv import load_dotenv
+from crewai import Agent, Crew, Task, Process
+from crewai.project import CrewBase, agent, task, crew
+from crewai.agents.agent_builder.base_agent import BaseAgent
+from typing import List
+
+from llm_clients import RateLimitedLLM
+from topic_history import topic_guardrail
+from tools.search_tool import SerperSearchTool
+from tools.image_generator_tool import image_generator_tool
+from tools.linkedin_poster_tool import linkedin_poster_tool
+
+# Load environment variables
+load_dotenv()
+text_key = os.getenv("GEMINI_API_KEY_TEXT")
+image_key = os.getenv("GEMINI_API_KEY_IMAGE")
+
+# Clients are built on first use, so importing this module stays cheap
+_llm_text = None
+_llm_image = None
+_search_tool = None
+_clients_lock = threading.Lock()
+
+def get_text_llm():
+    """Shared Gemini text LLM for the content and posting crews"""
+    global _llm_text
+    with _clients_lock:
+        if _llm_text is not None:
+            return _llm_text
+        # The key travels with the client; nothing process-wide is switched,
+        # so crews with different keys can run side by side
+        _llm_text = RateLimitedLLM(
+            model="gemini/gemini-2.5-flash",
+            api_key=text_key,
+            temperature=0.7,
+            max_rpm=5,
+            respect_context_window=True
+        )
+        return _llm_text
+
+def get_image_llm():
+    """Shared Gemini LLM for the image crew"""
+    global _llm_image
+    with _clients_lock:
+        if _llm_image is None:
+            _llm_image = RateLimitedLLM(
+                model="gemini/gemini-2.5-flash-image-preview",
+                api_key=image_key,
+                max_rpm=5,
+                respect_context_window=True
+            )
+        return _llm_image
+
+def get_search_tool():
+    """Shared cached Serper search tool"""
+    global _search_tool
+    with _clients_lock:
+        if _search_tool is None:
+            _search_tool = SerperSearchTool()
+        return _search_tool
+
+# Content Creation Crew
+@CrewBase
+class ContentCreationCrew:
+    agents: List[BaseAgent]
+    tasks: List[Task]
+
+    agents_config = "config/agents_content_creation.yaml"
+    tasks_config = "config/tasks_content_creation.yaml"
+    
+    @agent
+    def trend_researcher(self) -> Agent:
+        return Agent(
+            config=self.agents_config['trend_researcher'],
+            verbose=True,
+            llm=get_text_llm(),
+            tools=[get_search_tool()]
+        )
+    
+    @agent
+    def topic_researcher(self) -> Agent:
+        return Agent(
+            config=self.agents_config['topic_researcher'],
+            verbose=True,
+            llm=get_text_llm(),
+            tools=[get_search_tool()]
+        )
+    
+    @agent
+    def summarizer(self) -> Agent:
+        return Agent(
+            config=self.agents_config['summarizer'],
+            llm=get_text_llm(),
+            verbose=True
+        )
+    
+    @task
+    def find_trends_task(self) -> Task:
+        # Repeated topics are rejected here, before research and image generation
+        return Task(
+            config=self.tasks_config['find_trends_task'],
+            guardrail=topic_guardrail
+        )
+    
+    @task
+    def research_topic_task(self) -> Task:
+        return Task(
+            config=self.tasks_config['research_topic_task']
+        )
+    
+    @task
+    def summarize_post_task(self) -> Task:
+        return Task(
+            config=self.tasks_config['summarize_post_task']
+        )
+    
+    @crew
+    def crew(self) -> Crew:
+        return Crew(
+            agents=self.agents,
+            tasks=self.tasks,
+            process=Process.sequential,
+            llm=get_text_llm()
+        )
+
+# Image Generation Crew
+@CrewBase
+class ImageGenerationCrew:
+    agents: List[BaseAgent]
+    tasks: List[Task]
+
+    agents_config = "config/agents_image_generation.yaml"
+    tasks_config = "config/tasks_image_generation.yaml"
+    
+    @agent
+    def image_generator(self) -> Agent:
+        return Agent(
+            config=self.agents_config['image_generator'],
+            verbose=True,
+            tools=[image_generator_tool],
+            llm=get_image_llm()
+        )
+    
+    @task
+    def generate_image_task(self) -> Task:
+        return Task(
+            config=self.tasks_config['generate_image_task']
+        )
+    
+    @crew
+    def crew(self) -> Crew:
+        return Crew(
+            agents=self.agents,
+            tasks=self.tasks,
+            process=Process.sequential
+        )
+
+# LinkedIn Posting Crew
+@CrewBase
+class LinkedInPostingCrew:
+    agents: List[BaseAgent]
+    tasks: List[Task]
+
+    agents_config = "config/agents_linkedin_posting.yaml"
+    tasks_config = "config/tasks_linkedin_posting.yaml"
+    
+    @agent
+    def linkedin_poster(self) -> Agent:
+        return Agent(
+            config=self.agents_config['linkedin_poster'],
+            verbose=True,
+            llm=get_text_llm(),
+            tools=[linkedin_poster_tool]
+        )
+    
+    @task
+    def post_on_linkedin_task(self) -> Task:
+        return Task(
+            config=self.tasks_config['post_on_linkedin_task']
+        )
+    
+    @crew
+    def crew(self) -> Crew:
+        return Crew(
+            agents=self.agents,
+            tasks=self.tasks,
+            process=Process.sequential,
+            llm=get_text_llm()
+        )
+
+CREW_CLASSES = {
+    "content": ContentCreationCrew,
+    "image": ImageGenerationCrew,
+    "posting": LinkedInPostingCrew,
+}
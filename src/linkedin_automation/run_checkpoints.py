@@ -0,0 +1,97 @@
+import os
+import re
+import json
+import time
+import uuid
+import hashlib
+from tools.file_io import atomic_write
+
+STAGES = ("content", "image", "posting")
+IMAGE_PATH_PATTERN = re.compile(r"[\w./\\:-]+\.(?:png|jpe?g|webp)", re.IGNORECASE)
+
+def runs_root():
+    return os.getenv("PIPELINE_RUNS_DIR", "runs")
+
+def new_run_id():
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+def run_exists(run_id, root=None):
+    return os.path.isdir(os.path.join(root or runs_root(), run_id))
+
+def latest_run_id(root=None):
+    """Most recently modified run directory, or None"""
+    root = root or runs_root()
+    try:
+        runs = [name for name in os.listdir(root) if os.path.isdir(os.path.join(root, name))]
+    except OSError:
+        return None
+    return max(runs, key=lambda name: os.path.getmtime(os.path.join(root, name)), default=None)
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def find_image_path(text):
+    """First existing image file mentioned in an agent's answer, or None"""
+    candidates = [text.strip().strip("'\"`")] + IMAGE_PATH_PATTERN.findall(text)
+    for candidate in candidates:
+        if candidate and os.path.isfile(candidate):
+            return candidate
+    return None
+
+def _digest(data):
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+class RunCheckpoints:
+    """
+    Stage outputs of one pipeline run under runs/<run_id>/<stage>.json.
+    A checkpoint counts only if its checksum matches and, for the image stage,
+    the image file still exists with the recorded hash.
+    """
+
+    def __init__(self, run_id=None, root=None):
+        """A new run without run_id; with one, an existing run, which must be on disk"""
+        if run_id and not run_exists(run_id, root):
+            raise FileNotFoundError(f"No run {run_id} under {root or runs_root()}")
+        self.run_id = run_id or new_run_id()
+        self.directory = os.path.join(root or runs_root(), self.run_id)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, stage):
+        return os.path.join(self.directory, f"{stage}.json")
+
+    def save(self, stage, data):
+        document = {"stage": stage, "saved_at": time.time(), "data": data, "sha256": _digest(data)}
+        atomic_write(self._path(stage), json.dumps(document, indent=2))
+
+    def load(self, stage):
+        """Checkpointed data for a stage, or None when missing or no longer valid"""
+        try:
+            with open(self._path(stage)) as f:
+                document = json.load(f)
+        except (OSError, ValueError):
+            return None
+        data = document.get("data")
+        if data is None or document.get("sha256") != _digest(data):
+            print(f"⚠️ Checkpoint {stage} of run {self.run_id} is corrupt, rerunning the stage")
+            return None
+        if stage == "image":
+            path = data.get("image_path")
+            if not path:
+                return None
+            if not os.path.isfile(path) or file_sha256(path) != data.get("image_sha256"):
+                print(f"⚠️ Checkpointed image {path} is missing or changed, regenerating")
+                return None
+        if stage == "posting" and not data.get("ok"):
+            return None
+        return data
+
+    def save_image(self, raw):
+        """Checkpoint the image stage with the image path and its hash"""
+        path = find_image_path(raw)
+        data = {"raw": raw, "image_path": path, "image_sha256": file_sha256(path) if path else None}
+        self.save("image", data)
+        return data
@@ -0,0 +1,111 @@
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from tools.file_io import atomic_write, file_lock
+
+class DiskCache:
+    """
+    Content-addressed blob cache on disk with per-entry TTL and size-bounded
+    LRU eviction. Blobs live as <key>.<ext> files next to an index.json that
+    tracks size, creation, last access and expiry; safe to share between processes.
+    Size eviction spares entries used within the last min_lifetime seconds, so a
+    path just handed to a caller is not deleted under it by another writer.
+    """
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024, default_ttl=None, min_lifetime=0):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.min_lifetime = min_lifetime
+        self.index_file = os.path.join(directory, "index.json")
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    @contextmanager
+    def _locked(self):
+        with self._lock, file_lock(os.path.join(self.directory, ".lock")):
+            yield
+
+    def _read_index(self):
+        try:
+            with open(self.index_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index):
+        atomic_write(self.index_file, json.dumps(index))
+
+    def _blob_path(self, key, entry):
+        return os.path.join(self.directory, f"{key}.{entry.get('ext', 'bin')}")
+
+    def _drop(self, index, key):
+        entry = index.pop(key)
+        try:
+            os.remove(self._blob_path(key, entry))
+        except OSError:
+            pass
+
+    def _evict(self, index, now, keep=None):
+        for key in [k for k, e in index.items() if e.get("expires") and e["expires"] <= now and k != keep]:
+            self._drop(index, key)
+        total = sum(entry["size"] for entry in index.values())
+        for key in sorted(index, key=lambda k: index[k]["accessed"]):
+            if total <= self.max_bytes:
+                break
+            if key == keep or now - index[key]["accessed"] < self.min_lifetime:
+                continue
+            total -= index[key]["size"]
+            self._drop(index, key)
+
+    def get_path(self, key):
+        """Path of a live blob (and mark it recently used), or None"""
+        with self._locked():
+            index = self._read_index()
+            entry = index.get(key)
+            now = time.time()
+            path = self._blob_path(key, entry) if entry else None
+            if entry is None or (entry.get("expires") and entry["expires"] <= now) or not os.path.exists(path):
+                if entry is not None:
+                    self._drop(index, key)
+                    self._write_index(index)
+                self.misses += 1
+                return None
+            entry["accessed"] = now
+            self._write_index(index)
+            self.hits += 1
+            return path
+
+    def get(self, key):
+        """Cached bytes for key, or None"""
+        path = self.get_path(key)
+        if path is None:
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+
+    def put(self, key, data, ttl=None, ext="bin"):
+        """Store bytes under key and return the blob path; the new entry is never evicted by this call"""
+        ttl = self.default_ttl if ttl is None else ttl
+        with self._locked():
+            index = self._read_index()
+            now = time.time()
+            entry = {"size": len(data), "created": now, "accessed": now,
+                     "expires": now + ttl if ttl else None, "ext": ext}
+            path = self._blob_path(key, entry)
+            atomic_write(path, data)
+            index[key] = entry
+            self._evict(index, now, keep=key)
+            self._write_index(index)
+            self.writes += 1
+        return path
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "writes": self.writes,
+                "hit_rate": self.hits / lookups if lookups else 0.0}
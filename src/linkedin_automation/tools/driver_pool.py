@@ -0,0 +1,231 @@
+import os
+import time
+import queue
+import atexit
+import threading
+from contextlib import contextmanager
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from tools.tracing import traced
+from tools.session_store import AUTH_COOKIES
+
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Requests the lean profile never lets through: media, fonts and third-party trackers.
+# Typing and submitting a post only needs LinkedIn's own HTML, JS and API calls.
+BLOCKED_URL_PATTERNS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.mp4", "*.webm", "*.m3u8", "*.ts",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*media.licdn.com/dms/image*", "*dms.licdn.com/playlist*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*ads.linkedin.com*", "*px.ads.linkedin.com*", "*snap.licdn.com/li.lms-analytics*",
+    "*bing.com*", "*facebook.net*", "*demdex.net*", "*omtrdc.net*",
+]
+
+def browser_profile():
+    """'lean' or 'full' from LINKEDIN_BROWSER_PROFILE"""
+    return "lean" if os.getenv("LINKEDIN_BROWSER_PROFILE", "full").lower() == "lean" else "full"
+
+def default_profile_dir():
+    """Chrome profile directory used when none is given"""
+    return "/tmp/chrome_profile" if os.getenv("GITHUB_ACTIONS") else "./chrome_profile"
+
+def build_chrome_options(profile_dir, lean=False):
+    """Chrome options shared by one-shot and pooled drivers"""
+    chrome_options = Options()
+    if lean:
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--window-size=1280,800")
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--mute-audio")
+        chrome_options.add_argument("--autoplay-policy=user-gesture-required")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2
+        })
+    else:
+        #chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+    chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+    return chrome_options
+
+@traced("browser.start")
+def create_driver(profile_dir=None, lean=None):
+    """Launch a Chrome driver on the given profile directory"""
+    profile_dir = profile_dir or default_profile_dir()
+    lean = browser_profile() == "lean" if lean is None else lean
+    driver = webdriver.Chrome(service=Service(), options=build_chrome_options(profile_dir, lean))
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    if lean:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    return driver
+
+def pool_enabled():
+    """Whether LINKEDIN_DRIVER_POOL asks for pooled drivers or a warm pool already exists"""
+    return bool(_pools) or os.getenv("LINKEDIN_DRIVER_POOL", "").lower() in ("1", "true", "yes")
+
+class PooledDriver:
+    """A Chrome driver owned by the pool plus its bookkeeping"""
+
+    def __init__(self, driver, profile_dir):
+        self.driver = driver
+        self.profile_dir = profile_dir
+        self.created_at = time.time()
+        self.uses = 0
+        self.logged_in = False
+        self.broken = False
+
+class DriverPool:
+    """
+    Long-lived pool of logged-in Chrome drivers.
+    Drivers are launched lazily, health-checked on every lease and
+    recycled after max_uses leases or once the page heap grows past max_heap_mb.
+    """
+
+    def __init__(self, size=1, max_uses=20, max_heap_mb=512, profile_dir=None):
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.max_heap_mb = max_heap_mb
+        self.profile_dir = profile_dir or default_profile_dir()
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._launched = 0
+        self._free_profiles = [self._profile_for(i) for i in range(self.size)]
+        self._closed = False
+
+    def _profile_for(self, index):
+        # Chrome refuses to share one user-data-dir between live browsers
+        return self.profile_dir if index == 0 else f"{self.profile_dir}_{index}"
+
+    def _launch(self):
+        with self._lock:
+            profile_dir = self._free_profiles.pop(0)
+        try:
+            print(f"🚀 Launching pooled browser ({profile_dir})")
+            return PooledDriver(create_driver(profile_dir), profile_dir)
+        except Exception:
+            with self._lock:
+                self._free_profiles.append(profile_dir)
+                self._launched -= 1
+            raise
+
+    def _acquire(self, timeout):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            can_launch = self._launched < self.size
+            if can_launch:
+                self._launched += 1
+        if can_launch:
+            return self._launch()
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No pooled browser became free within {timeout}s (pool size {self.size})"
+            ) from None
+
+    def _heap_mb(self, pooled):
+        used = pooled.driver.execute_script(
+            "return (window.performance && performance.memory) ? performance.memory.usedJSHeapSize : 0;"
+        )
+        return (used or 0) / (1024 * 1024)
+
+    def _still_logged_in(self, pooled):
+        """False once LinkedIn dropped the session: login page or auth cookies gone"""
+        current_url = pooled.driver.current_url
+        if any(marker in current_url for marker in ("login", "authwall", "checkpoint")):
+            return False
+        return all(pooled.driver.get_cookie(name) for name in AUTH_COOKIES)
+
+    def _healthy(self, pooled):
+        """
+        Check the browser still answers and is within its use and memory budget.
+        A live browser whose LinkedIn session expired stays in service but is
+        marked logged out, so the lease logs in again before handing it over.
+        """
+        if pooled.broken or pooled.uses >= self.max_uses:
+            return False
+        try:
+            if not pooled.driver.window_handles:
+                return False
+            if self._heap_mb(pooled) > self.max_heap_mb:
+                print(f"♻️ Recycling browser, JS heap above {self.max_heap_mb} MB")
+                return False
+            if pooled.logged_in and not self._still_logged_in(pooled):
+                print("⚠️ Pooled browser lost its LinkedIn session, logging in again")
+                pooled.logged_in = False
+            return True
+        except Exception:
+            return False
+
+    def _retire(self, pooled):
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+        with self._lock:
+            self._launched -= 1
+            self._free_profiles.append(pooled.profile_dir)
+        print(f"🔒 Pooled browser retired after {pooled.uses} uses")
+
+    @contextmanager
+    def lease(self, timeout=300):
+        """Lease a healthy driver; it returns to the pool when the block exits"""
+        if self._closed:
+            raise RuntimeError("Driver pool is shut down")
+        pooled = self._acquire(timeout)
+        while not self._healthy(pooled):
+            self._retire(pooled)
+            pooled = self._acquire(timeout)
+        pooled.uses += 1
+        try:
+            yield pooled
+        except Exception:
+            pooled.broken = True
+            raise
+        finally:
+            if pooled.broken or self._closed or pooled.uses >= self.max_uses:
+                self._retire(pooled)
+            else:
+                self._idle.put(pooled)
+
+    def shutdown(self):
+        """Quit every idle browser"""
+        self._closed = True
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._retire(pooled)
+
+_pools = {}
+_pool_lock = threading.Lock()
+
+def get_driver_pool(profile_dir=None):
+    """Process-wide pool per profile directory, configured from LINKEDIN_POOL_* environment variables"""
+    profile_dir = profile_dir or default_profile_dir()
+    with _pool_lock:
+        if profile_dir not in _pools:
+            pool = DriverPool(
+                size=int(os.getenv("LINKEDIN_POOL_SIZE", "1")),
+                max_uses=int(os.getenv("LINKEDIN_POOL_MAX_USES", "20")),
+                max_heap_mb=int(os.getenv("LINKEDIN_POOL_MAX_HEAP_MB", "512")),
+                profile_dir=profile_dir,
+            )
+            atexit.register(pool.shutdown)
+            _pools[profile_dir] = pool
+        return _pools[profile_dir]
@@ -0,0 +1,41 @@
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to unlocked writes
+    fcntl = None
+
+def atomic_write(path, data):
+    """
+    Write str or bytes to path through a temporary file and os.replace, so
+    readers see either the old or the new content, never a partial write.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    # Unique per process and thread, so concurrent writers never share a temp file
+    tmp_file = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_file, "wb" if isinstance(data, (bytes, bytearray)) else "w") as f:
+            f.write(data)
+        os.replace(tmp_file, path)
+    except BaseException:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        raise
+
+@contextmanager
+def file_lock(path):
+    """Exclusive inter-process lock held on path for the duration of the block"""
+    if fcntl is None:
+        yield
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
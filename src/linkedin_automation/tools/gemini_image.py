@@ -0,0 +1,31 @@
+import os
+from google import genai
+from tools.rate_limiter import get_rate_limiter, estimate_tokens
+
+GEMINI_IMAGE_MODEL = "gemini-2.5-flash-image-preview"
+
+def generate_image_bytes_gemini(prompt, cancel_event=None):
+    """
+    Raw image bytes from Gemini's multimodal model.
+    Raises RuntimeError when the key is missing or no image comes back.
+    """
+    api_key_image = os.getenv("GEMINI_API_KEY_IMAGE")
+    if not api_key_image:
+        raise RuntimeError("GEMINI_API_KEY_IMAGE not set in environment.")
+    if cancel_event is not None and cancel_event.is_set():
+        raise RuntimeError("Cancelled before the request was sent")
+
+    client = genai.Client(api_key=api_key_image)
+    # Waits only as long as this key's quota actually requires
+    response = get_rate_limiter(GEMINI_IMAGE_MODEL, api_key_image).call(
+        client.models.generate_content,
+        model=GEMINI_IMAGE_MODEL,
+        contents=[prompt],
+        tokens=estimate_tokens(prompt)
+    )
+
+    # Loop through parts, check for image data
+    for part in response.candidates[0].content.parts:
+        if getattr(part, "inline_data", None) is not None:
+            return part.inline_data.data
+    raise RuntimeError("No image returned from Gemini.")
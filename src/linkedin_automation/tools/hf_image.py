@@ -0,0 +1,117 @@
+import os
+import time
+import threading
+from collections import Counter, deque
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from tools.rate_limiter import get_rate_limiter
+
+HF_API_BASE = "https://api-inference.huggingface.co"
+DEFAULT_HF_MODEL = "black-forest-labs/FLUX.1-schnell"
+
+class HFInferenceClient:
+    """
+    Shared Hugging Face inference client: one pooled keep-alive session,
+    explicit connect/read timeouts, and retries on 503 "model loading"
+    answers that wait as long as the server's estimated_time says.
+    """
+
+    def __init__(self, base_url=None, token=None, connect_timeout=None, read_timeout=None,
+                 max_loading_wait=None, pool_size=4):
+        self.base_url = (base_url or os.getenv("HF_API_BASE", HF_API_BASE)).rstrip("/")
+        self.token = token if token is not None else os.getenv("HF_TOKEN")
+        self.timeout = (float(connect_timeout or os.getenv("HF_CONNECT_TIMEOUT", "5")),
+                        float(read_timeout or os.getenv("HF_READ_TIMEOUT", "120")))
+        self.max_loading_wait = float(max_loading_wait or os.getenv("HF_MAX_LOADING_WAIT", "300"))
+        self.session = requests.Session()
+        # Connection-level failures only; HTTP statuses are handled below
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                              max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.5))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Authorization": f"Bearer {self.token}", "Content-Type": "application/json"})
+        self.latencies = deque(maxlen=200)
+        self.statuses = Counter()
+        self.loading_retries = 0
+        self._lock = threading.Lock()
+
+    def _post_checked(self, url, payload):
+        """POST that raises on 429 so the rate limiter can back off and retry"""
+        started = time.monotonic()
+        response = self.session.post(url, json=payload, timeout=self.timeout)
+        with self._lock:
+            self.latencies.append(time.monotonic() - started)
+            self.statuses[response.status_code] += 1
+        if response.status_code == 429:
+            response.raise_for_status()
+        return response
+
+    @staticmethod
+    def _estimated_time(response):
+        try:
+            return float(response.json().get("estimated_time"))
+        except (ValueError, TypeError, AttributeError):
+            return None
+
+    def infer(self, model_name, payload, cancel_event=None):
+        """Raw response bytes for a model; raises RuntimeError on a non-200 answer"""
+        url = f"{self.base_url}/models/{model_name}"
+        limiter = get_rate_limiter("huggingface", self.token)
+        deadline = time.monotonic() + self.max_loading_wait
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                raise RuntimeError("Cancelled before the request was sent")
+            response = limiter.call(self._post_checked, url, payload)
+            if response.status_code == 200:
+                return response.content
+            estimated = self._estimated_time(response) if response.status_code == 503 else None
+            remaining = deadline - time.monotonic()
+            if estimated is None or remaining <= 0:
+                raise RuntimeError(f"Hugging Face returned {response.status_code}: {response.text[:300]}")
+            wait = min(max(estimated, 1.0), remaining)
+            print(f"⏳ {model_name} is loading, retrying in {wait:.0f}s")
+            with self._lock:
+                self.loading_retries += 1
+            # An Event wait so a cancelled race stops sleeping right away
+            if cancel_event is not None:
+                if cancel_event.wait(wait):
+                    raise RuntimeError("Cancelled while the model was loading")
+            else:
+                time.sleep(wait)
+
+    def metrics(self):
+        """Request count, latency percentiles, status counts and loading retries"""
+        with self._lock:
+            latencies = sorted(self.latencies)
+            statuses = dict(self.statuses)
+            retries = self.loading_retries
+        pick = lambda q: round(latencies[min(len(latencies) - 1, int(q * len(latencies)))], 3) if latencies else None
+        return {"requests": len(latencies), "p50": pick(0.5), "p95": pick(0.95),
+                "statuses": statuses, "loading_retries": retries}
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_hf_client():
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HFInferenceClient()
+    return _client
+
+def generate_image_bytes_hf(prompt, model_name=DEFAULT_HF_MODEL, cancel_event=None):
+    """
+    Raw image bytes from the Hugging Face Inference API.
+    Raises RuntimeError with the response body on a non-200 answer.
+    """
+    payload = {
+        "inputs": prompt,
+        "parameters": {
+            "guidance_scale": 7.5,  # How closely to follow the prompt
+            "num_inference_steps": 20,  # Quality vs speed tradeoff
+            "width": 1024,
+            "height": 1024
+        }
+    }
+    return get_hf_client().infer(model_name, payload, cancel_event=cancel_event)
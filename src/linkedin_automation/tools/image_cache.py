@@ -0,0 +1,63 @@
+import os
+import json
+import hashlib
+import tempfile
+from tools.disk_cache import DiskCache
+from tools.image_output import image_extension, upload_bytes, optimize_enabled, write_image_bytes
+
+_cache = None
+
+def get_image_cache():
+    """Generated images shared across runs under IMAGE_CACHE_DIR"""
+    global _cache
+    if _cache is None:
+        _cache = DiskCache(
+            os.getenv("IMAGE_CACHE_DIR", ".cache/images"),
+            max_bytes=int(os.getenv("IMAGE_CACHE_MAX_MB", "256")) * 1024 * 1024,
+            default_ttl=float(os.getenv("IMAGE_CACHE_TTL_HOURS", "72")) * 3600,
+            # Long enough for a run to go from generating its image to posting it
+            min_lifetime=float(os.getenv("IMAGE_CACHE_MIN_LIFETIME_MINUTES", "60")) * 60,
+        )
+    return _cache
+
+def image_cache_key(prompt, model, optimize=None):
+    """sha256 over the prompt, the model and whether the upload is optimized"""
+    optimize = optimize_enabled() if optimize is None else optimize
+    payload = json.dumps({"prompt": prompt.strip(), "model": model, "optimize": optimize}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def cached_image_path(prompt, models):
+    """Path of a cached image for this prompt from any of the given models, or None"""
+    cache = get_image_cache()
+    for model in models:
+        path = cache.get_path(image_cache_key(prompt, model))
+        if path is not None:
+            return path
+    return None
+
+def store_image(prompt, model, data):
+    """
+    Save a generated image under its content address and return the path.
+    Each prompt gets its own file, so concurrent runs never overwrite each other.
+    An image that cannot be cached is written to a file of its own for this run.
+    """
+    data = upload_bytes(data)
+    ext = image_extension(data)
+    if ext is None:
+        raise ValueError("Unrecognized image payload")
+    cache = get_image_cache()
+    key = image_cache_key(prompt, model)
+    if len(data) <= cache.max_bytes:
+        try:
+            return cache.put(key, data, ext=ext.lstrip("."))
+        except OSError as e:
+            print(f"⚠️ Could not cache image: {e}")
+    else:
+        print(f"⚠️ Image of {len(data) // 1024} KB exceeds IMAGE_CACHE_MAX_MB, not caching it")
+    fd, path = tempfile.mkstemp(prefix=f"linkedin_image_{key[:12]}_", suffix=ext)
+    os.close(fd)
+    return write_image_bytes(data, path)
+
+def image_cache_report():
+    """Hit/miss counters of the image cache, or None when it was never used"""
+    return _cache.stats() if _cache else None
@@ -1,42 +1,35 @@
 from crewai.tools import tool
-from google import genai
-from google.genai import types
-from PIL import Image
-from io import BytesIO
-import os
 from dotenv import load_dotenv
-import time
+from tools.image_cache import cached_image_path, store_image
+from tools.tracing import span
 
 load_dotenv()
 
 @tool("image_generator_tool")
 def image_generator_tool(prompt: str) -> str:
     """
-    Generate an image using Google's Gemini multimodal model.
-    Requires GEMINI_API_KEY_IMAGE in environment variables.
+    Generate an image for the post. Races the configured backends (Gemini via
+    GEMINI_API_KEY_IMAGE, Hugging Face via HF_TOKEN) and keeps the first valid image.
     """
-    try:
-        api_key_image = os.getenv("GEMINI_API_KEY_IMAGE")
-        if not api_key_image:
-            return "Error: GEMINI_API_KEY not set in environment."
-        print("Using api_key_image")
-        time.sleep(60)
-        
-        client = genai.Client(api_key=api_key_image)
-        response = client.models.generate_content(
-            model="gemini-2.5-flash-image-preview",
-            contents=[prompt]
-        )
+    # Backend SDKs load on first use, not when the crew module is imported
+    from tools.image_orchestrator import get_image_orchestrator
+    from tools.gemini_image import GEMINI_IMAGE_MODEL
+    from tools.hf_image import DEFAULT_HF_MODEL
 
-        # Loop through parts, check for image data
-        for part in response.candidates[0].content.parts:
-            if getattr(part, "inline_data", None) is not None:
-                image = Image.open(BytesIO(part.inline_data.data))
-                image_path = "src/linkedin_automation/tools/data/ai_post.png"
-                image.save(image_path)
-                return image_path
+    try:
+        with span("tool.image_generator") as current:
+            orchestrator = get_image_orchestrator()
+            models = {"gemini": GEMINI_IMAGE_MODEL, "huggingface": DEFAULT_HF_MODEL}
+            # Same prompt and model as an earlier run (e.g. a retry): reuse that image
+            cached_path = cached_image_path(prompt, [models.get(name, name) for name in orchestrator.ordered()])
+            if cached_path:
+                print(f"♻️ Reusing cached image {cached_path}")
+                return cached_path
 
-        return "Error: No image returned from Gemini."
+            backend, data = orchestrator.generate(prompt)
+            if current is not None:
+                current.set_attribute("backend", backend)
+            return store_image(prompt, models.get(backend, backend), data)
 
     except Exception as e:
-        return f"❌ Gemini image generation failed: {str(e)}"
+        return f"❌ Image generation failed: {str(e)}"
@@ -0,0 +1,147 @@
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from tools.file_io import atomic_write
+from tools.image_output import image_extension
+
+MIN_IMAGE_BYTES = 1024
+
+def is_valid_image(data):
+    """Non-trivial PNG, JPEG or WEBP payload"""
+    return (isinstance(data, (bytes, bytearray)) and len(data) >= MIN_IMAGE_BYTES
+            and image_extension(data) is not None)
+
+def default_backends():
+    """Image backends whose credentials are configured, as {name: fn(prompt, cancel_event) -> bytes}"""
+    from tools.gemini_image import generate_image_bytes_gemini
+    from tools.hf_image import generate_image_bytes_hf
+
+    available = {}
+    if os.getenv("GEMINI_API_KEY_IMAGE"):
+        available["gemini"] = generate_image_bytes_gemini
+    if os.getenv("HF_TOKEN"):
+        available["huggingface"] = lambda prompt, cancel_event=None: generate_image_bytes_hf(prompt, cancel_event=cancel_event)
+    enabled = os.getenv("IMAGE_BACKENDS")
+    if enabled:
+        names = [name.strip() for name in enabled.split(",")]
+        available = {name: available[name] for name in names if name in available}
+    return available
+
+class ImageOrchestrator:
+    """
+    Sends one prompt to several image backends at once and keeps the first
+    valid image within a latency budget. Latency and success rate per backend
+    are persisted so the preferred order adapts across runs.
+    """
+
+    def __init__(self, backends=None, stats_file=None, budget_seconds=None):
+        self.backends = backends if backends is not None else default_backends()
+        self.stats_file = stats_file or os.getenv("IMAGE_BACKEND_STATS", ".cache/image_backend_stats.json")
+        self.budget_seconds = budget_seconds or float(os.getenv("IMAGE_LATENCY_BUDGET", "120"))
+        self._lock = threading.Lock()
+        self.stats = self._load()
+
+    def _load(self):
+        try:
+            with open(self.stats_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        atomic_write(self.stats_file, json.dumps(self.stats, indent=2))
+
+    def record(self, name, ok, seconds):
+        """Update a backend's success count and latency moving average"""
+        with self._lock:
+            entry = self.stats.setdefault(name, {"attempts": 0, "successes": 0, "latency_ewma": None})
+            entry["attempts"] += 1
+            if ok:
+                entry["successes"] += 1
+                previous = entry["latency_ewma"]
+                entry["latency_ewma"] = seconds if previous is None else 0.7 * previous + 0.3 * seconds
+            self._save()
+
+    def record_cancelled(self, name):
+        """Count a backend stopped because another one won; leaves its success rate alone"""
+        with self._lock:
+            entry = self.stats.setdefault(name, {"attempts": 0, "successes": 0, "latency_ewma": None})
+            entry["cancelled"] = entry.get("cancelled", 0) + 1
+            self._save()
+
+    def ordered(self):
+        """Backends by expected success per second; untried backends first so they get measured"""
+        def score(name):
+            entry = self.stats.get(name)
+            if not entry or not entry["attempts"]:
+                return float("inf")
+            success_rate = (entry["successes"] + 1) / (entry["attempts"] + 2)
+            # A backend that never succeeded is scored as if it took the whole budget
+            latency = entry["latency_ewma"] if entry["latency_ewma"] is not None else self.budget_seconds
+            return success_rate / max(latency, 0.1)
+        return sorted(self.backends, key=score, reverse=True)
+
+    def generate(self, prompt, budget_seconds=None):
+        """(backend, image bytes) of the first valid image; raises TimeoutError or RuntimeError"""
+        if not self.backends:
+            raise RuntimeError("No image backends configured (set GEMINI_API_KEY_IMAGE and/or HF_TOKEN)")
+        budget = budget_seconds or self.budget_seconds
+        deadline = time.monotonic() + budget
+        cancel_event = threading.Event()
+        race = {"winner": None}
+        errors = {}
+        names = self.ordered()
+
+        executor = ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="image-backend")
+        started = time.monotonic()
+        futures = {executor.submit(self.backends[name], prompt, cancel_event): name for name in names}
+
+        def finish(future):
+            # Losing backends still report their outcome so stats stay honest
+            name = futures[future]
+            ok = not future.cancelled() and future.exception() is None and is_valid_image(future.result())
+            if not ok and race["winner"] is not None:
+                # Stopped by the race, not a failure of this backend
+                self.record_cancelled(name)
+                return
+            self.record(name, ok, time.monotonic() - started)
+
+        for future in futures:
+            future.add_done_callback(finish)
+
+        try:
+            pending = set(futures)
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                # Respect the preferred order among backends that finished together
+                for future in sorted(done, key=lambda f: names.index(futures[f])):
+                    name = futures[future]
+                    if future.exception() is not None:
+                        errors[name] = str(future.exception())
+                        continue
+                    data = future.result()
+                    if is_valid_image(data):
+                        print(f"🏁 Image from {name} in {time.monotonic() - started:.1f}s")
+                        race["winner"] = name
+                        return name, data
+                    errors[name] = "invalid image payload"
+        finally:
+            cancel_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if errors and len(errors) == len(names):
+            raise RuntimeError(f"All image backends failed: {errors}")
+        raise TimeoutError(f"No image within {budget:g}s budget (errors: {errors or 'none'})")
+
+_orchestrator = None
+
+def get_image_orchestrator():
+    global _orchestrator
+    if _orchestrator is None:
+        _orchestrator = ImageOrchestrator()
+    return _orchestrator
@@ -0,0 +1,70 @@
+import os
+from io import BytesIO
+from tools.file_io import atomic_write
+
+IMAGE_FORMATS = {
+    b"\x89PNG\r\n\x1a\n": ".png",
+    b"\xff\xd8\xff": ".jpg",
+}
+# LinkedIn renders feed images at most 1200px wide; anything larger is downscaled on their side
+LINKEDIN_MAX_SIDE = 1200
+
+def image_extension(data):
+    """File extension matching the payload's magic bytes, or None"""
+    for magic, ext in IMAGE_FORMATS.items():
+        if data.startswith(magic):
+            return ext
+    # RIFF also wraps WAV and AVI; only the WEBP form type is an image
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return ".webp"
+    return None
+
+def write_image_bytes(data, output_path):
+    """
+    Write provider bytes to disk as they are, without decoding. The extension
+    of output_path is corrected to the real format; returns the written path.
+    """
+    ext = image_extension(data)
+    if ext is None:
+        raise ValueError("Unrecognized image payload")
+    path = os.path.splitext(output_path)[0] + ext
+    atomic_write(path, data)
+    return path
+
+def optimized_for_linkedin(data, max_side=LINKEDIN_MAX_SIDE, quality=None):
+    """JPEG bytes no larger than max_side on either edge"""
+    from PIL import Image
+
+    quality = quality or int(os.getenv("IMAGE_JPEG_QUALITY", "85"))
+    image = Image.open(BytesIO(data))
+    image.draft("RGB", (max_side, max_side))  # lets JPEG decode at reduced scale
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    image.thumbnail((max_side, max_side), Image.LANCZOS)
+    buffer = BytesIO()
+    image.save(buffer, "JPEG", quality=quality, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+def optimize_enabled():
+    return os.getenv("IMAGE_OPTIMIZE", "").lower() in ("1", "true", "yes")
+
+def upload_bytes(data, optimize=None):
+    """
+    Bytes to upload for a generated image. By default the provider's bytes are
+    returned untouched; with optimize (or IMAGE_OPTIMIZE=1) a LinkedIn-sized
+    JPEG is returned instead when it is actually smaller.
+    """
+    optimize = optimize_enabled() if optimize is None else optimize
+    if optimize:
+        try:
+            small = optimized_for_linkedin(data)
+            if len(small) < len(data):
+                print(f"🗜️ Image optimized: {len(data) // 1024} KB → {len(small) // 1024} KB")
+                return small
+        except Exception as e:
+            print(f"⚠️ Could not optimize image, keeping original: {e}")
+    return data
+
+def persist_image(data, output_path, optimize=None):
+    """Save a generated image (see upload_bytes) and return the written path"""
+    return write_image_bytes(upload_bytes(data, optimize), output_path)
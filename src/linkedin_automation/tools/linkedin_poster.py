@@ -0,0 +1,464 @@
+import time
+import os
+import random
+import base64
+import threading
+from contextlib import contextmanager
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from tools.driver_pool import create_driver, get_driver_pool, pool_enabled, browser_profile, PooledDriver
+from tools.page_metrics import page_metrics
+from tools.session_store import SessionStore, save_stats
+from tools.session_hydration import hydrate_session, linkedin_url, on_linkedin
+from tools.selector_resolver import get_selector_resolver
+from tools.typing_engine import type_text
+from tools.tracing import span, traced
+from tools.wait_engine import (
+    try_wait_for, wait_stats, any_of, network_idle,
+    element_present, url_contains, publish_toast
+)
+
+NAV_XPATH = "//button[contains(@class, 'global-nav__primary-link')]"
+
+# Candidate selectors per UI element; SelectorResolver races them and learns their order
+START_POST_SELECTORS = [
+    "//button//span[contains(text(), 'Start a post')]",
+    "//button//strong[text()='Start a post']",
+    "//div[contains(@class, 'share-box-feed-entry__trigger')]",
+    "//button[contains(@class, 'share-box-feed-entry__trigger')]",
+    "//span[text()='Start a post']/ancestor::button"
+]
+
+POST_BOX_SELECTORS = [
+    "//div[contains(@class,'ql-editor')]",
+    "//div[@role='textbox']",
+    "//div[contains(@class, 'editor-content')]",
+    "//div[@contenteditable='true']"
+]
+
+MEDIA_BUTTON_SELECTORS = [
+    "//button[contains(@aria-label, 'Add media')]",
+    "//button[contains(@aria-label, 'Add a photo')]",
+    "//button[contains(@class, 'share-promoted-detour-button')][contains(@aria-label, 'media')]"
+]
+
+MEDIA_INPUT_SELECTORS = [
+    "//div[@role='dialog']//input[@type='file']",
+    "//input[@type='file'][contains(@accept, 'image')]",
+    "//input[@type='file']"
+]
+
+MEDIA_DONE_SELECTORS = [
+    "//button[.//span[text()='Next']]",
+    "//button[.//span[text()='Done']]",
+    "//button[contains(@class, 'share-box-footer__primary-btn')]"
+]
+
+POST_BUTTON_SELECTORS = [
+    "//button[contains(@class,'share-actions__primary-action')]//span[text()='Post']",
+    "//button//span[text()='Post']",
+    "//button[contains(@class, 'share-actions__primary-action')]",
+    "//button[contains(@class, 'artdeco-button--primary')][contains(.,'Post')]"
+]
+
+# Every result the posting tools returned, in order. The pipeline reads its
+# outcome from here rather than from the agent's retelling of it.
+publish_log = []
+
+def record_publish_result(result):
+    """Log a posting tool's result and return it unchanged"""
+    publish_log.append({"ok": result.startswith("✅"), "result": result, "at": time.time()})
+    return result
+
+@traced("poster.session_save")
+def save_session_data(driver, session_file=None, account=None, profile=None):
+    """Snapshot cookies and storage from the current page; write only if they changed"""
+    try:
+        if not on_linkedin(driver.current_url):
+            print("⚠️ Not on LinkedIn, skipping session snapshot")
+            return False
+        
+        session_data = {
+            'cookies': driver.get_cookies(),
+            'local_storage': driver.execute_script("return window.localStorage;") or {},
+            'session_storage': driver.execute_script("return window.sessionStorage;") or {},
+            'user_agent': driver.execute_script("return navigator.userAgent;")
+        }
+        
+        account = account or os.getenv("LINKEDIN_EMAIL", "")
+        if SessionStore(session_file).put_if_changed(account, profile, session_data):
+            print("✅ Session data saved")
+        else:
+            print(f"💤 Session unchanged, skipped write ({save_stats['skipped']} skipped / {save_stats['written']} written)")
+        return True
+    except Exception as e:
+        print(f"❌ Failed to save session: {e}")
+        return False
+
+def load_session_data(driver, session_file=None, account=None, profile=None):
+    """Load cookies and session data from the session store"""
+    try:
+        store = SessionStore(session_file)
+        account = account or os.getenv("LINKEDIN_EMAIL", "")
+        
+        # Decide from stored cookie expiries before touching the browser
+        usable, reason = store.check(account, profile)
+        if not usable:
+            print(f"🔍 Stored session not usable: {reason}")
+            return False
+        session_data = store.get(account, profile)
+        
+        # Cookies and storage go in before the first LinkedIn navigation
+        method = hydrate_session(driver, session_data)
+        
+        print(f"✅ Session data loaded ({method})")
+        return True
+    except Exception as e:
+        print(f"❌ Failed to load session: {e}")
+        return False
+
+def decode_session_from_github(session_file=None):
+    """Decode session from GitHub secret into the session store"""
+    try:
+        session_data_b64 = os.getenv("LINKEDIN_SESSION_DATA")
+        if not session_data_b64:
+            return False
+        
+        session_bytes = base64.b64decode(session_data_b64)
+        SessionStore(session_file).import_document(session_bytes)
+        
+        print("✅ Session decoded from GitHub secrets")
+        return True
+    except Exception as e:
+        print(f"❌ Failed to decode session: {e}")
+        return False
+
+def human_like_typing(element, text, min_delay=0.05, max_delay=0.15, mode=None):
+    """Type text with human-like delays; mode defaults to LINKEDIN_TYPING_MODE"""
+    return type_text(element, text, mode=mode, min_delay=min_delay, max_delay=max_delay)
+
+@traced("poster.login")
+def linkedin_login_with_session(driver, linkedin_email, linkedin_password, session_file=None, profile=None):
+    """Login with session persistence"""
+    wait = WebDriverWait(driver, 20)
+    
+    # If running in GitHub Actions, decode session from secrets
+    if os.getenv("GITHUB_ACTIONS"):
+        print("🔧 Running in GitHub Actions, loading session...")
+        decode_session_from_github(session_file)
+    
+    # Try to load existing session first
+    if load_session_data(driver, session_file, linkedin_email, profile):
+        print("🔄 Testing saved session...")
+        driver.get(linkedin_url("/feed/"))
+        print("⏳ LinkedIn feed loading...")
+        
+        # Logged in once the nav renders; a dead session lands on login instead
+        logged_in = try_wait_for(driver, any_of(
+            element_present((By.XPATH, NAV_XPATH)),
+            url_contains("login", "authwall", "signup")
+        ), "feed_load")
+        page_metrics.mark(driver, "login")
+        current_url = driver.current_url
+        if logged_in and ("feed" in current_url or "home" in current_url):
+            print("✅ Session login successful!")
+            return True
+        print("⚠️ Session expired, will try fresh login")
+    
+    # Fresh login required
+    print("🔑 Performing fresh login...")
+    driver.get(linkedin_url("/login"))
+    
+    try:
+        wait.until(EC.presence_of_element_located((By.ID, "username")))
+        
+        # Enter credentials with human-like typing
+        username_field = driver.find_element(By.ID, "username")
+        human_like_typing(username_field, linkedin_email)
+        time.sleep(random.uniform(1, 2))
+        
+        password_field = driver.find_element(By.ID, "password")
+        human_like_typing(password_field, linkedin_password)
+        time.sleep(random.uniform(1, 2))
+        
+        # Click login button
+        try:
+            login_button = driver.find_element(By.XPATH, "//button[@type='submit']")
+            driver.execute_script("arguments[0].click();", login_button)
+        except:
+            password_field.send_keys(Keys.RETURN)
+        
+        print("⏳ Waiting for login...")
+        try_wait_for(driver, url_contains("feed", "home", "challenge", "checkpoint"), "login_redirect")
+        page_metrics.mark(driver, "login")
+        
+        current_url = driver.current_url
+        
+        # Handle post-login scenarios
+        if "challenge" in current_url or "checkpoint" in current_url:
+            print("🛡️ Security challenge detected, waiting...")
+            # Wait up to 5 minutes for the challenge to resolve
+            if try_wait_for(driver, url_contains("feed", "home"), "security_challenge", poll=2):
+                print("✅ Challenge resolved!")
+                save_session_data(driver, session_file, linkedin_email, profile)
+                return True
+            return False
+                
+        elif "feed" in current_url or "home" in current_url:
+            print("✅ Login successful!")
+            save_session_data(driver, session_file, linkedin_email, profile)
+            return True
+        
+        return False
+            
+    except Exception as e:
+        print(f"❌ Login error: {e}")
+        return False
+
+@traced("poster.media")
+def attach_media(driver, image_path):
+    """Upload an image into the open composer through LinkedIn's media editor"""
+    resolver = get_selector_resolver()
+    
+    media_button = resolver.resolve(driver, "media_button", MEDIA_BUTTON_SELECTORS, timeout=10)
+    if media_button:
+        driver.execute_script("arguments[0].click();", media_button)
+    
+    file_input = resolver.resolve(driver, "media_input", MEDIA_INPUT_SELECTORS, timeout=10, clickable=False, visible=False)
+    if not file_input:
+        return False
+    file_input.send_keys(os.path.abspath(image_path))
+    
+    # The media editor needs a Next/Done before returning to the composer
+    done_button = resolver.resolve(driver, "media_done", MEDIA_DONE_SELECTORS, timeout=60)
+    if not done_button:
+        return False
+    driver.execute_script("arguments[0].click();", done_button)
+    print(f"🖼️ Attached media {os.path.basename(image_path)}")
+    return True
+
+def publish_post(driver, post_text, image_path=None):
+    """Open the composer on a logged-in driver, type the text and publish it"""
+    resolver = get_selector_resolver()
+
+    # Navigate to feed if needed
+    current_url = driver.current_url
+    if "feed" not in current_url:
+        driver.get(linkedin_url("/feed/"))
+        try_wait_for(driver, network_idle(), "feed_load")
+        page_metrics.mark(driver, "feed")
+    
+    with span("poster.composer_open"):
+        # Find "Start a post" button
+        print("🔍 Looking for 'Start a post' button...")
+        start_post = resolver.resolve(driver, "start_post", START_POST_SELECTORS)
+        if not start_post:
+            return "❌ Error: Could not find 'Start a post' button."
+        
+        driver.execute_script("arguments[0].click();", start_post)
+        print("✅ Clicked 'Start a post' button")
+        
+        # Find post composer
+        print("✏️ Looking for post composer...")
+        post_box = resolver.resolve(driver, "post_box", POST_BOX_SELECTORS)
+        if not post_box:
+            return "❌ Error: Could not find post text box."
+    page_metrics.mark(driver, "composer_open")
+    
+    # Enter text
+    post_box.click()
+    post_box.send_keys(Keys.CONTROL + "a")
+    report = human_like_typing(post_box, post_text, 0.02, 0.08)
+    print(f"✅ Entered post text ({report})")
+    page_metrics.mark(driver, "type")
+    
+    if image_path:
+        if not os.path.exists(image_path):
+            return f"❌ Error: Image not found at {image_path}."
+        if not attach_media(driver, image_path):
+            return "❌ Error: Could not attach image to the post."
+        page_metrics.mark(driver, "media")
+        # The media editor can re-render the composer; confirm against the live editor
+        post_box = resolver.resolve(driver, "post_box", POST_BOX_SELECTORS, timeout=5) or post_box
+    
+    with span("poster.publish"):
+        # Find and click post button
+        print("📤 Looking for Post button...")
+        post_button = resolver.resolve(driver, "post_button", POST_BUTTON_SELECTORS)
+        if not post_button:
+            return "❌ Error: Could not find Post button."
+        
+        # The dialog around the editor we typed into, or the editor itself outside one
+        composer = driver.execute_script(
+            "return arguments[0].closest(\"[role='dialog']\") || arguments[0];", post_box
+        )
+        driver.execute_script("arguments[0].click();", post_button)
+        print("✅ Clicked Post button")
+        
+        # Published once the toast shows or that composer leaves the page
+        confirmed = try_wait_for(driver, any_of(
+            publish_toast(),
+            EC.staleness_of(composer)
+        ), "publish_confirm")
+    page_metrics.mark(driver, "publish")
+    wait_stats.print_summary()
+    page_metrics.print_summary(browser_profile())
+    if not confirmed:
+        return "⚠️ Clicked Post but LinkedIn did not confirm the post was published."
+    
+    return "✅ Successfully posted to LinkedIn!"
+
+def save_session_if_logged_in(driver, account=None, session_file=None):
+    """Persist the session unless the browser ended up on the login page"""
+    try:
+        current_url = driver.current_url
+        if on_linkedin(current_url) and "login" not in current_url:
+            save_session_data(driver, session_file, account)
+    except:
+        pass
+
+@contextmanager
+def logged_in_browser(linkedin_email, linkedin_password, profile_dir=None, session_file=None):
+    """
+    Yield a logged-in PooledDriver handle, or None if login failed.
+    Leases from the warm pool for profile_dir when LINKEDIN_DRIVER_POOL is set,
+    otherwise launches a one-shot browser that is closed on exit.
+    """
+    if pool_enabled():
+        with get_driver_pool(profile_dir).lease() as pooled:
+            if not pooled.logged_in:
+                if not linkedin_login_with_session(pooled.driver, linkedin_email, linkedin_password, session_file):
+                    pooled.broken = True
+                    yield None
+                    return
+                pooled.logged_in = True
+            try:
+                yield pooled
+            finally:
+                save_session_if_logged_in(pooled.driver, linkedin_email, session_file)
+        return
+    
+    driver = None
+    try:
+        driver = create_driver(profile_dir)
+        
+        # Login with session persistence
+        if not linkedin_login_with_session(driver, linkedin_email, linkedin_password, session_file):
+            yield None
+            return
+        
+        yield PooledDriver(driver, profile_dir)
+        
+    finally:
+        if driver:
+            # Save session before closing
+            save_session_if_logged_in(driver, linkedin_email, session_file)
+            driver.quit()
+            print("🔒 Browser closed")
+
+def publish_on(browser, post):
+    """Publish one post dict on a logged-in browser handle"""
+    result = publish_post(browser.driver, post.get("text", ""), post.get("image_path"))
+    if not result.startswith("✅"):
+        # Leave no half-open composer behind for the next lease
+        browser.broken = True
+    return result
+
+def publish_batch(posts, linkedin_email, linkedin_password, spacing_seconds=None, profile_dir=None, session_file=None):
+    """
+    Publish posts in order through one logged-in session.
+    Each post is a dict {"text": ..., "image_path": optional}.
+    Returns one {"index", "ok", "result", "seconds"} dict per post.
+    """
+    if spacing_seconds is None:
+        spacing_seconds = float(os.getenv("LINKEDIN_BATCH_SPACING", "30"))
+    results = []
+    
+    with logged_in_browser(linkedin_email, linkedin_password, profile_dir, session_file) as browser:
+        for index, post in enumerate(posts):
+            if browser is None:
+                results.append({"index": index, "ok": False, "seconds": 0.0,
+                                "result": "❌ Error: Failed to login to LinkedIn."})
+                continue
+            if index and spacing_seconds:
+                print(f"⏳ Waiting {spacing_seconds:.0f}s before the next post...")
+                time.sleep(spacing_seconds)
+            
+            started = time.monotonic()
+            try:
+                result = publish_on(browser, post)
+            except Exception as e:
+                browser.broken = True
+                result = f"❌ Error: {str(e)}"
+            if browser.broken:
+                # Put the page back in a known state before the next post
+                browser.broken = False
+                try:
+                    driver = browser.driver
+                    driver.get(linkedin_url("/feed/"))
+                    try_wait_for(driver, network_idle(), "feed_load")
+                except Exception:
+                    pass
+            results.append({"index": index, "ok": result.startswith("✅"), "result": result,
+                            "seconds": round(time.monotonic() - started, 2)})
+            print(f"📬 Post {index + 1}/{len(posts)}: {result}")
+    
+    return results
+
+def start_browser_warmup(linkedin_email=None, linkedin_password=None):
+    """
+    Launch, restore and log in a pooled browser on a background thread.
+    The first post then leases the already-authenticated browser, or waits
+    on the lease if warm-up is still running.
+    """
+    linkedin_email = linkedin_email or os.getenv("LINKEDIN_EMAIL")
+    linkedin_password = linkedin_password or os.getenv("LINKEDIN_PASSWORD")
+    if not linkedin_email or not linkedin_password:
+        print("⚠️ Skipping browser warm-up, LinkedIn credentials not set")
+        return None
+    
+    get_driver_pool()
+    
+    def warm_up():
+        started = time.monotonic()
+        try:
+            with logged_in_browser(linkedin_email, linkedin_password) as browser:
+                if browser is None:
+                    print("⚠️ Browser warm-up could not log in; posting will retry")
+                    return
+            print(f"🔥 Browser warm and logged in after {time.monotonic() - started:.1f}s")
+        except Exception as e:
+            print(f"⚠️ Browser warm-up failed: {e}")
+    
+    thread = threading.Thread(target=warm_up, name="browser-warmup", daemon=True)
+    thread.start()
+    return thread
+
+def validate_post(post):
+    """Error string for a malformed post dict, or None"""
+    if not isinstance(post, dict) or "text" not in post:
+        return "❌ Error: post_data must be a dict with at least a 'text' key."
+    return None
+
+def post_once(post_data):
+    """
+    Publish one post with LINKEDIN_EMAIL/LINKEDIN_PASSWORD from the environment.
+    Never raises: every failure comes back as an "❌ Error: ..." string, and the
+    result is recorded in publish_log.
+    """
+    try:
+        linkedin_email = os.getenv("LINKEDIN_EMAIL")
+        linkedin_password = os.getenv("LINKEDIN_PASSWORD")
+        
+        if not linkedin_email or not linkedin_password:
+            result = "❌ Error: Please set LINKEDIN_EMAIL and LINKEDIN_PASSWORD in environment."
+        else:
+            result = validate_post(post_data)
+            if result is None:
+                with logged_in_browser(linkedin_email, linkedin_password) as browser:
+                    result = publish_on(browser, post_data) if browser else "❌ Error: Failed to login to LinkedIn."
+    except Exception as e:
+        result = f"❌ Error: {str(e)}"
+    return record_publish_result(result)
@@ -0,0 +1,73 @@
+import os
+import time
+import yaml
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+def default_accounts_file():
+    return os.getenv("LINKEDIN_ACCOUNTS_FILE", "src/linkedin_automation/config/accounts.yaml")
+
+def load_accounts(path=None, names=None):
+    """
+    Account registry from YAML: {name: {email_env, password_env, profile_dir?, session_file?}}.
+    Every account gets its own Chrome profile directory and session store.
+    """
+    with open(path or default_accounts_file()) as f:
+        registry = yaml.safe_load(f) or {}
+    accounts = []
+    for name, entry in registry.items():
+        if names and name not in names:
+            continue
+        accounts.append({
+            "name": name,
+            "email_env": entry.get("email_env", "LINKEDIN_EMAIL"),
+            "password_env": entry.get("password_env", "LINKEDIN_PASSWORD"),
+            "profile_dir": entry.get("profile_dir") or os.path.join("./chrome_profiles", name),
+            "session_file": entry.get("session_file") or os.path.join("/tmp/linkedin_sessions", f"{name}.json"),
+        })
+    return accounts
+
+def post_for_account(account, posts):
+    """Worker: publish posts for one account in its own process and browser"""
+    # Imported here so the parent process never loads Selenium or crewai
+    from tools.linkedin_poster import publish_batch
+    
+    started = time.monotonic()
+    email = os.getenv(account["email_env"])
+    password = os.getenv(account["password_env"])
+    if not email or not password:
+        results = [{"index": i, "ok": False, "seconds": 0.0,
+                    "result": f"❌ Error: Please set {account['email_env']} and {account['password_env']} in environment."}
+                   for i in range(len(posts))]
+    else:
+        os.makedirs(os.path.dirname(account["session_file"]) or ".", exist_ok=True)
+        results = publish_batch(posts, email, password,
+                                profile_dir=account["profile_dir"], session_file=account["session_file"])
+    return {"account": account["name"], "results": results, "seconds": round(time.monotonic() - started, 2)}
+
+def post_for_accounts(posts, accounts, max_workers=None):
+    """Publish the same posts for every account concurrently; returns one report per account"""
+    max_workers = max_workers or int(os.getenv("LINKEDIN_ACCOUNT_CONCURRENCY", "2"))
+    reports = []
+    with ProcessPoolExecutor(max_workers=max(1, min(max_workers, len(accounts)))) as executor:
+        futures = {executor.submit(post_for_account, account, posts): account for account in accounts}
+        for future in as_completed(futures):
+            account = futures[future]
+            try:
+                reports.append(future.result())
+            except Exception as e:
+                reports.append({"account": account["name"], "seconds": 0.0, "results": [
+                    {"index": i, "ok": False, "seconds": 0.0, "result": f"❌ Error: {str(e)}"}
+                    for i in range(len(posts))
+                ]})
+    order = [account["name"] for account in accounts]
+    return sorted(reports, key=lambda report: order.index(report["account"]))
+
+def print_report(reports):
+    """Combined per-account table of what was published"""
+    print(f"{'Account':<24} {'OK':>5} {'Failed':>7} {'Time (s)':>9}")
+    for report in reports:
+        ok = sum(1 for r in report["results"] if r["ok"])
+        print(f"{report['account']:<24} {ok:>5} {len(report['results']) - ok:>7} {report['seconds']:>9}")
+        for r in report["results"]:
+            if not r["ok"]:
+                print(f"    post {r['index'] + 1}: {r['result']}")
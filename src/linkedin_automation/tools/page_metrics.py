@@ -0,0 +1,74 @@
+import time
+import threading
+
+# Totals for the current document. Cross-origin resources without
+# Timing-Allow-Origin report a transferSize of 0, so bytes are a lower bound.
+PAGE_METRICS_JS = """
+performance.setResourceTimingBufferSize(10000);
+const nav = performance.getEntriesByType('navigation')[0];
+let bytes = nav ? nav.transferSize : 0;
+for (const entry of performance.getEntriesByType('resource')) {
+    bytes += entry.transferSize || 0;
+}
+return {
+    origin: performance.timeOrigin,
+    bytes: bytes,
+    requests: performance.getEntriesByType('resource').length,
+    load_ms: nav && nav.loadEventEnd ? nav.loadEventEnd - nav.startTime : null
+};
+"""
+
+class PageMetrics:
+    """Bytes transferred, page-load time and wall time attributed to each posting step"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last = {}
+        self.samples = {}
+
+    def mark(self, driver, step):
+        """Record what the page transferred since the previous mark on this driver"""
+        try:
+            current = driver.execute_script(PAGE_METRICS_JS)
+        except Exception:
+            return None
+        current["at"] = time.monotonic()
+        with self._lock:
+            last = self._last.get(id(driver))
+            same_document = last is not None and last["origin"] == current["origin"]
+            sample = {
+                # Time since the previous step on this driver; None for its first mark
+                "seconds": current["at"] - last["at"] if last is not None else None,
+                "bytes": current["bytes"] - last["bytes"] if same_document else current["bytes"],
+                "requests": current["requests"] - last["requests"] if same_document else current["requests"],
+                # A new document means this step paid for a full page load
+                "load_ms": None if same_document else current["load_ms"],
+            }
+            self._last[id(driver)] = current
+            self.samples.setdefault(step, []).append(sample)
+        return sample
+
+    def summary(self):
+        """{step: {"count", "avg_kb", "avg_requests", "avg_load_ms", "avg_seconds"}}"""
+        with self._lock:
+            samples = {step: list(values) for step, values in self.samples.items()}
+        result = {}
+        for step, values in samples.items():
+            loads = [value["load_ms"] for value in values if value["load_ms"] is not None]
+            seconds = [value["seconds"] for value in values if value["seconds"] is not None]
+            result[step] = {
+                "count": len(values),
+                "avg_kb": sum(value["bytes"] for value in values) / len(values) / 1024,
+                "avg_requests": sum(value["requests"] for value in values) / len(values),
+                "avg_load_ms": sum(loads) / len(loads) if loads else None,
+                "avg_seconds": sum(seconds) / len(seconds) if seconds else None,
+            }
+        return result
+
+    def print_summary(self, profile=""):
+        for step, stats in self.summary().items():
+            load = f" load={stats['avg_load_ms']:.0f}ms" if stats["avg_load_ms"] is not None else ""
+            took = f" took={stats['avg_seconds']:.2f}s" if stats["avg_seconds"] is not None else ""
+            print(f"📦 [{profile}] {step}: {stats['avg_kb']:.1f} KB in {stats['avg_requests']:.0f} requests{load}{took}")
+
+page_metrics = PageMetrics()
@@ -0,0 +1,156 @@
+import os
+import json
+import time
+import hashlib
+import threading
+
+# Requests and tokens per minute per (model, API key). Override with RATE_LIMITS,
+# a JSON object such as {"gemini-2.5-flash": {"rpm": 15, "tpm": 1000000}}.
+DEFAULT_LIMITS = {
+    "gemini-2.5-flash": {"rpm": 10, "tpm": 250000},
+    "gemini-2.5-flash-lite": {"rpm": 15, "tpm": 250000},
+    "gemini-2.5-flash-image-preview": {"rpm": 10, "tpm": 200000},
+    "serper": {"rpm": 100, "tpm": None},
+    "huggingface": {"rpm": 30, "tpm": None},
+}
+FALLBACK_LIMITS = {"rpm": 10, "tpm": None}
+
+def configured_limits(model):
+    """RPM/TPM for a model name, with or without a provider prefix"""
+    overrides = json.loads(os.getenv("RATE_LIMITS", "{}") or "{}")
+    name = model.split("/", 1)[-1]
+    for table in (overrides, DEFAULT_LIMITS):
+        if model in table:
+            return table[model]
+        if name in table:
+            return table[name]
+    return FALLBACK_LIMITS
+
+def is_rate_limit_error(error):
+    """True for HTTP 429 / RESOURCE_EXHAUSTED errors from any of our clients"""
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    response = getattr(error, "response", None)
+    if status is None and response is not None:
+        status = getattr(response, "status_code", None)
+    if status == 429:
+        return True
+    text = str(error)
+    return "429" in text or "RESOURCE_EXHAUSTED" in text or "rate limit" in text.lower()
+
+def retry_after_seconds(error):
+    """Server-provided Retry-After in seconds, if the error carries one"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After") or headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+class TokenBucket:
+    """Reservation-based token bucket: callers are told how long to wait, in arrival order"""
+
+    def __init__(self, per_minute):
+        self.per_minute = per_minute
+        self.rate = per_minute / 60.0
+        self.tokens = float(per_minute)
+        self.updated = time.monotonic()
+
+    def reserve(self, amount, now):
+        self.tokens = min(self.per_minute, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= amount
+        # Negative balance = queue of reservations ahead of us
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+class RateLimiter:
+    """
+    Quota for one (model, API key): an RPM bucket, an optional TPM bucket and
+    an adaptive factor that halves the rate on every 429 and creeps back on success.
+    """
+
+    def __init__(self, name, rpm, tpm=None):
+        self.name = name
+        self.base_rpm = rpm
+        self.base_tpm = tpm
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm) if tpm else None
+        self.factor = 1.0
+        self.blocked_until = 0.0
+        self.waited = 0.0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _apply_factor(self):
+        self.requests.rate = self.base_rpm * self.factor / 60.0
+        if self.tokens:
+            self.tokens.rate = self.base_tpm * self.factor / 60.0
+
+    def acquire(self, tokens=0):
+        """Block only as long as the quota requires; returns seconds waited"""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(self.blocked_until - now, 0.0, self.requests.reserve(1, now))
+            if self.tokens and tokens:
+                wait = max(wait, self.tokens.reserve(min(tokens, self.base_tpm), now))
+            self.calls += 1
+            self.waited += wait
+        if wait > 0:
+            print(f"⏳ Rate limiter [{self.name}]: waiting {wait:.1f}s")
+            time.sleep(wait)
+        return wait
+
+    def report_success(self):
+        with self._lock:
+            if self.factor < 1.0:
+                self.factor = min(1.0, self.factor + 0.1)
+                self._apply_factor()
+
+    def report_rate_limited(self, retry_after=None):
+        """Back off after a 429: pause everyone and halve the rate"""
+        with self._lock:
+            self.factor = max(0.1, self.factor / 2)
+            self._apply_factor()
+            pause = retry_after if retry_after is not None else 60.0 / max(self.base_rpm * self.factor, 1)
+            self.blocked_until = max(self.blocked_until, time.monotonic() + pause)
+        print(f"🐢 Rate limiter [{self.name}]: 429 received, rate now {self.factor:.0%} for {pause:.0f}s+")
+
+    def call(self, fn, *args, tokens=0, max_retries=3, **kwargs):
+        """Run fn under this quota, retrying with backoff on rate-limit errors"""
+        for attempt in range(max_retries + 1):
+            self.acquire(tokens)
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if attempt < max_retries and is_rate_limit_error(e):
+                    self.report_rate_limited(retry_after_seconds(e))
+                    continue
+                raise
+            self.report_success()
+            return result
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+def key_fingerprint(api_key):
+    return hashlib.sha256((api_key or "").encode()).hexdigest()[:12]
+
+def get_rate_limiter(model, api_key=None):
+    """Process-wide limiter shared by every caller using this model and key"""
+    key = (model, key_fingerprint(api_key))
+    with _limiters_lock:
+        if key not in _limiters:
+            limits = configured_limits(model)
+            _limiters[key] = RateLimiter(f"{model}:{key[1][:6]}", limits["rpm"], limits.get("tpm"))
+        return _limiters[key]
+
+def estimate_tokens(text):
+    """Rough token count (~4 characters per token) for TPM accounting"""
+    return len(str(text)) // 4 + 1
+
+def limiter_report():
+    """{name: {"calls", "waited", "factor"}} for every limiter used so far"""
+    with _limiters_lock:
+        return {
+            limiter.name: {"calls": limiter.calls, "waited": round(limiter.waited, 2), "factor": limiter.factor}
+            for limiter in _limiters.values()
+        }
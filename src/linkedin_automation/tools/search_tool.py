@@ -0,0 +1,98 @@
+import os
+import re
+import json
+import hashlib
+import threading
+from concurrent.futures import Future
+from crewai_tools import SerperDevTool
+from tools.disk_cache import DiskCache
+from tools.rate_limiter import get_rate_limiter
+from tools.tracing import span
+
+HOUR = 3600
+# Trend and news queries go stale within hours; tutorials and docs for days
+FRESH_QUERY_TTL = 6 * HOUR
+DEFAULT_QUERY_TTL = 24 * HOUR
+EVERGREEN_QUERY_TTL = 7 * 24 * HOUR
+
+FRESH_WORDS = {"latest", "today", "trending", "trend", "trends", "news", "new", "recent", "week", "breaking"}
+EVERGREEN_WORDS = {"tutorial", "guide", "docs", "documentation", "how", "introduction", "explained", "example", "examples"}
+STOP_WORDS = {"a", "an", "the", "of", "in", "on", "for", "to", "and", "or", "about", "with", "is", "are", "what"}
+
+def normalize_query(query):
+    """Order-, case- and punctuation-insensitive key for near-identical queries"""
+    words = re.findall(r"[a-z0-9+#.]+", str(query).lower())
+    return " ".join(sorted({word.strip(".") for word in words if word.strip(".") not in STOP_WORDS}))
+
+def query_ttl(normalized_query, search_type="search"):
+    """Cache lifetime for a query based on how fast its results change"""
+    words = set(normalized_query.split())
+    if search_type == "news" or words & FRESH_WORDS:
+        return FRESH_QUERY_TTL
+    if words & EVERGREEN_WORDS:
+        return EVERGREEN_QUERY_TTL
+    return DEFAULT_QUERY_TTL
+
+_cache = None
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+
+def get_search_cache():
+    """Search results shared across agents and runs under SEARCH_CACHE_DIR"""
+    global _cache
+    if _cache is None:
+        _cache = DiskCache(os.getenv("SEARCH_CACHE_DIR", ".cache/serper"), max_bytes=32 * 1024 * 1024)
+    return _cache
+
+class SerperSearchTool(SerperDevTool):
+    """
+    SerperDevTool with a persistent TTL cache on normalized queries, in-flight
+    deduplication of identical concurrent queries and the shared rate limiter.
+    """
+
+    def _cache_key(self, kwargs):
+        query = kwargs.get("search_query") or kwargs.get("query") or ""
+        options = {k: v for k, v in kwargs.items() if k not in ("search_query", "query")}
+        options.update(search_type=getattr(self, "search_type", "search"),
+                       country=getattr(self, "country", None), location=getattr(self, "location", None),
+                       n_results=getattr(self, "n_results", None))
+        normalized = normalize_query(query)
+        raw = json.dumps({"q": normalized, "options": options}, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest(), normalized
+
+    def _search(self, **kwargs):
+        limiter = get_rate_limiter("serper", os.getenv("SERPER_API_KEY"))
+        return limiter.call(super()._run, **kwargs)
+
+    def _run(self, **kwargs):
+        with span("tool.serper_search"):
+            return self._run_cached(**kwargs)
+
+    def _run_cached(self, **kwargs):
+        key, normalized = self._cache_key(kwargs)
+        cache = get_search_cache()
+        cached = cache.get(key)
+        if cached is not None:
+            return json.loads(cached)["result"]
+
+        with _in_flight_lock:
+            pending = _in_flight.get(key)
+            owner = pending is None
+            if owner:
+                pending = _in_flight[key] = Future()
+        if not owner:
+            # Someone else is already running this exact query
+            return pending.result()
+
+        try:
+            result = self._search(**kwargs)
+            cache.put(key, json.dumps({"query": normalized, "result": result}, default=str).encode(),
+                      ttl=query_ttl(normalized, getattr(self, "search_type", "search")), ext="json")
+            pending.set_result(result)
+            return result
+        except Exception as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with _in_flight_lock:
+                _in_flight.pop(key, None)
@@ -0,0 +1,91 @@
+import os
+import json
+import time
+import threading
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from tools.wait_engine import wait_for
+from tools.file_io import atomic_write
+
+class SelectorResolver:
+    """
+    Races every candidate XPath for a UI element in a single polling loop.
+    Hit/miss counts per selector are kept on disk so the selector that won
+    last time is checked first on the next run.
+    """
+
+    def __init__(self, stats_file=None):
+        self.stats_file = stats_file or os.getenv("LINKEDIN_SELECTOR_STATS", "/tmp/linkedin_selector_stats.json")
+        self._lock = threading.Lock()
+        self.stats = self._load()
+
+    def _load(self):
+        try:
+            with open(self.stats_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        try:
+            atomic_write(self.stats_file, json.dumps(self.stats, indent=2))
+        except OSError as e:
+            print(f"⚠️ Could not save selector stats: {e}")
+
+    def ordered(self, element, selectors):
+        """Most recent winner first, then by hit rate, then by the given order"""
+        element_stats = self.stats.get(element, {})
+
+        def rank(item):
+            index, selector = item
+            entry = element_stats.get(selector, {})
+            hits, misses = entry.get("hits", 0), entry.get("misses", 0)
+            hit_rate = hits / (hits + misses) if hits + misses else 0.0
+            return (-entry.get("last_hit", 0), -hit_rate, index)
+
+        return [selector for _, selector in sorted(enumerate(selectors), key=rank)]
+
+    def _record(self, element, winner, tried):
+        with self._lock:
+            element_stats = self.stats.setdefault(element, {})
+            for selector in tried:
+                entry = element_stats.setdefault(selector, {"hits": 0, "misses": 0})
+                if selector == winner:
+                    entry["hits"] += 1
+                    entry["last_hit"] = time.time()
+                else:
+                    entry["misses"] += 1
+            self._save()
+
+    def resolve(self, driver, element, selectors, timeout=30, clickable=True, visible=True):
+        """Return the first displayed (and enabled) match among selectors, or None"""
+        candidates = self.ordered(element, selectors)
+
+        def first_match(driver):
+            for selector in candidates:
+                for found in driver.find_elements(By.XPATH, selector):
+                    try:
+                        if (not visible or found.is_displayed()) and (not clickable or found.is_enabled()):
+                            return selector, found
+                    except StaleElementReferenceException:
+                        continue
+            return False
+
+        try:
+            winner, found = wait_for(driver, first_match, element, timeout=timeout, poll=0.2)
+        except TimeoutException:
+            self._record(element, None, candidates)
+            return None
+
+        # Selectors checked ahead of the winner did not match on the final pass
+        self._record(element, winner, candidates[:candidates.index(winner) + 1])
+        return found
+
+_resolver = None
+
+def get_selector_resolver():
+    """Process-wide resolver backed by LINKEDIN_SELECTOR_STATS"""
+    global _resolver
+    if _resolver is None:
+        _resolver = SelectorResolver()
+    return _resolver
@@ -0,0 +1,99 @@
+import os
+import json
+from urllib.parse import urlparse
+from tools.wait_engine import try_wait_for, document_ready
+
+DEFAULT_LINKEDIN_ORIGIN = "https://www.linkedin.com"
+
+def linkedin_origin():
+    """Site the poster drives; LINKEDIN_BASE_URL points it at a local stand-in"""
+    return os.getenv("LINKEDIN_BASE_URL", DEFAULT_LINKEDIN_ORIGIN).rstrip("/")
+
+def linkedin_url(path):
+    return linkedin_origin() + path
+
+def linkedin_domain():
+    """Cookie domain of the site, e.g. linkedin.com"""
+    host = urlparse(linkedin_origin()).hostname or ""
+    return host[4:] if host.startswith("www.") else host
+
+def on_linkedin(url):
+    host = urlparse(url).hostname or ""
+    domain = linkedin_domain()
+    return host == domain or host.endswith("." + domain)
+
+# Runs before any page script on every new document. Keys LinkedIn has already
+# written win, so later navigations never roll storage back to the snapshot.
+STORAGE_BOOTSTRAP_JS = """
+(function () {
+    if (!location.hostname.endsWith(%s)) return;
+    const items = %s;
+    for (const [key, value] of Object.entries(items)) {
+        if (window.localStorage.getItem(key) === null) {
+            window.localStorage.setItem(key, value);
+        }
+    }
+})();
+"""
+
+RESTORE_STORAGE_JS = """
+const items = arguments[0];
+for (const [key, value] of Object.entries(items)) {
+    window.localStorage.setItem(key, value);
+}
+"""
+
+def to_cdp_cookie(cookie):
+    """Selenium cookie dict -> DevTools Network.CookieParam"""
+    cdp_cookie = {
+        "name": cookie["name"],
+        "value": cookie["value"],
+        "domain": cookie.get("domain") or "." + linkedin_domain(),
+        "path": cookie.get("path", "/"),
+        "secure": cookie.get("secure", False),
+        "httpOnly": cookie.get("httpOnly", False),
+    }
+    if "expiry" in cookie:
+        cdp_cookie["expires"] = cookie["expiry"]
+    if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+        cdp_cookie["sameSite"] = cookie["sameSite"]
+    return cdp_cookie
+
+def _storage_items(session_data):
+    # JSON round trip keeps every value a string and quotes it safely
+    return {str(key): str(value) for key, value in (session_data.get("local_storage") or {}).items()}
+
+def hydrate_with_cdp(driver, session_data):
+    """Restore all cookies and localStorage in two DevTools calls, before any navigation"""
+    driver.execute_cdp_cmd("Network.setCookies", {
+        "cookies": [to_cdp_cookie(cookie) for cookie in session_data.get("cookies", [])]
+    })
+    items = _storage_items(session_data)
+    if items:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+            "source": STORAGE_BOOTSTRAP_JS % (json.dumps(linkedin_domain()), json.dumps(items))
+        })
+
+def hydrate_with_webdriver(driver, session_data):
+    """Fallback for drivers without DevTools: cookies need a LinkedIn page loaded first"""
+    driver.get(linkedin_origin())
+    try_wait_for(driver, document_ready, "session_restore")
+    for cookie in session_data.get("cookies", []):
+        try:
+            driver.add_cookie(cookie)
+        except Exception:
+            continue
+    items = _storage_items(session_data)
+    if items:
+        driver.execute_script(RESTORE_STORAGE_JS, items)
+
+def hydrate_session(driver, session_data):
+    """Restore a stored session into the browser, preferring the DevTools path"""
+    if hasattr(driver, "execute_cdp_cmd"):
+        try:
+            hydrate_with_cdp(driver, session_data)
+            return "cdp"
+        except Exception as e:
+            print(f"⚠️ DevTools hydration failed ({e}), falling back to WebDriver")
+    hydrate_with_webdriver(driver, session_data)
+    return "webdriver"
@@ -0,0 +1,185 @@
+import os
+import json
+import time
+import pickle
+import hashlib
+from tools.file_io import atomic_write, file_lock
+
+SCHEMA_VERSION = 1
+DEFAULT_PROFILE = "default"
+# Cookies LinkedIn needs for an authenticated session
+AUTH_COOKIES = ("li_at", "JSESSIONID")
+# Rewrite an unchanged session this often so saved_at keeps up with max age
+REFRESH_SECONDS = 24 * 3600
+
+# How often put_if_changed wrote to disk versus found nothing new
+save_stats = {"written": 0, "skipped": 0}
+
+def default_session_file():
+    """Session store path from LINKEDIN_SESSION_FILE"""
+    return os.getenv("LINKEDIN_SESSION_FILE", "/tmp/linkedin_session.json")
+
+def session_key(account, profile=None):
+    return f"{(account or '').strip().lower()}|{profile or DEFAULT_PROFILE}"
+
+def has_auth_cookies(cookies, names=AUTH_COOKIES):
+    present = {cookie.get("name") for cookie in cookies}
+    return all(name in present for name in names)
+
+def cookie_expiry(cookies, names=AUTH_COOKIES):
+    """Earliest expiry among the named cookies; None when none of them carries one"""
+    # Session cookies carry no expiry; they live as long as the stored entry
+    expiries = [cookie["expiry"] for cookie in cookies
+                if cookie.get("name") in names and "expiry" in cookie]
+    return min(expiries) if expiries else None
+
+def session_state_hash(session_data, names=AUTH_COOKIES):
+    """
+    Hash of the auth cookie values and localStorage.
+    Tracking cookies (lidc, bcookie, UserMatchHistory...) and sessionStorage change
+    on nearly every page load without affecting the login, so they are left out,
+    as are expiry bumps.
+    """
+    cookies = sorted(
+        (cookie.get("name"), cookie.get("value"), cookie.get("domain"), cookie.get("path"))
+        for cookie in session_data.get("cookies", [])
+        if cookie.get("name") in names
+    )
+    state = {
+        "cookies": cookies,
+        "local_storage": session_data.get("local_storage") or {},
+    }
+    return hashlib.sha256(json.dumps(state, sort_keys=True, default=str).encode()).hexdigest()
+
+class SessionStore:
+    """
+    JSON session store with a schema version, one entry per (account, profile).
+    Entries record cookie expiries so a session can be judged usable offline,
+    before Chrome is launched.
+    """
+
+    def __init__(self, path=None, max_age_days=7):
+        self.path = path or default_session_file()
+        self.max_age = max_age_days * 24 * 3600
+
+    def _locked(self):
+        return file_lock(f"{self.path}.lock")
+
+    def _read(self):
+        empty = {"schema_version": SCHEMA_VERSION, "sessions": {}}
+        try:
+            with open(self.path, "rb") as f:
+                raw = f.read()
+        except OSError:
+            return empty
+        if raw.startswith(b"\x80"):
+            return self._from_legacy_pickle(raw, saved_at=os.path.getmtime(self.path))
+        try:
+            document = json.loads(raw)
+        except ValueError:
+            print(f"⚠️ Ignoring unreadable session store {self.path}")
+            return empty
+        if document.get("schema_version") != SCHEMA_VERSION:
+            print(f"⚠️ Session store schema {document.get('schema_version')} is not supported, starting fresh")
+            return empty
+        return document
+
+    def _from_legacy_pickle(self, raw, saved_at):
+        """
+        Import a pre-JSON /tmp/linkedin_session.pkl payload under the env account.
+        The pickle carries no timestamp, so the caller says when it was saved.
+        """
+        document = {"schema_version": SCHEMA_VERSION, "sessions": {}}
+        try:
+            legacy = pickle.loads(raw)
+        except Exception:
+            return document
+        entry = self._entry(os.getenv("LINKEDIN_EMAIL", ""), DEFAULT_PROFILE, legacy)
+        entry["saved_at"] = saved_at
+        document["sessions"][session_key(entry["account"])] = entry
+        return document
+
+    def _write(self, document):
+        atomic_write(self.path, json.dumps(document))
+
+    @staticmethod
+    def _entry(account, profile, session_data):
+        cookies = session_data.get("cookies", [])
+        return {
+            "account": account,
+            "profile": profile or DEFAULT_PROFILE,
+            "saved_at": time.time(),
+            "has_auth": has_auth_cookies(cookies),
+            "expires_at": cookie_expiry(cookies),
+            "cookies": cookies,
+            "local_storage": session_data.get("local_storage") or {},
+            "session_storage": session_data.get("session_storage") or {},
+            "user_agent": session_data.get("user_agent"),
+            "state_hash": session_state_hash(session_data),
+        }
+
+    def get(self, account, profile=None):
+        """Stored entry for an account/profile, or None"""
+        return self._read()["sessions"].get(session_key(account, profile))
+
+    def put(self, account, profile, session_data):
+        """Store cookies/storage snapshot for an account/profile"""
+        with self._locked():
+            document = self._read()
+            document["sessions"][session_key(account, profile)] = self._entry(account, profile, session_data)
+            self._write(document)
+
+    def put_if_changed(self, account, profile, session_data):
+        """Store the snapshot only if it differs from the stored one; True if written"""
+        state_hash = session_state_hash(session_data)
+        with self._locked():
+            document = self._read()
+            key = session_key(account, profile)
+            stored = document["sessions"].get(key)
+            if (stored and stored.get("state_hash") == state_hash
+                    and time.time() - stored.get("saved_at", 0) < REFRESH_SECONDS):
+                save_stats["skipped"] += 1
+                return False
+            document["sessions"][key] = self._entry(account, profile, session_data)
+            self._write(document)
+        save_stats["written"] += 1
+        return True
+
+    def entries(self):
+        return list(self._read()["sessions"].values())
+
+    def import_document(self, raw):
+        """Merge a serialized store (e.g. from LINKEDIN_SESSION_DATA) into this file"""
+        if raw.startswith(b"\x80"):
+            # An imported payload was fresh when exported; this file's mtime says nothing about it
+            incoming = self._from_legacy_pickle(raw, saved_at=time.time())
+        else:
+            incoming = json.loads(raw)
+            if incoming.get("schema_version") != SCHEMA_VERSION:
+                raise ValueError(f"unsupported session schema {incoming.get('schema_version')}")
+        with self._locked():
+            document = self._read()
+            document["sessions"].update(incoming["sessions"])
+            self._write(document)
+
+    def check(self, account, profile=None, margin=3600):
+        """(usable, reason) judged from stored expiries alone, without a browser"""
+        entry = self.get(account, profile)
+        if entry is None:
+            return False, "no stored session"
+        now = time.time()
+        if now - entry.get("saved_at", 0) > self.max_age:
+            return False, "session older than max age"
+        if not entry.get("has_auth"):
+            return False, "auth cookies missing"
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at < now + margin:
+            return False, "auth cookies expired"
+        return True, "ok"
+
+if __name__ == "__main__":
+    store = SessionStore()
+    print(f"Session store: {store.path}")
+    for entry in store.entries():
+        usable, reason = store.check(entry["account"], entry["profile"])
+        print(f"{'✅' if usable else '❌'} {entry['account']} [{entry['profile']}]: {reason}")
@@ -0,0 +1,133 @@
+import os
+import json
+import time
+import atexit
+import functools
+import threading
+from contextlib import contextmanager
+
+# Every span is timed here as well, so the summary works without OpenTelemetry
+_lock = threading.Lock()
+_samples = {}
+_provider = None
+_tracer = None
+_tracer_ready = False
+
+def trace_export():
+    """TRACE_EXPORT: json (default, JSON lines in TRACE_FILE), otlp or none"""
+    return os.getenv("TRACE_EXPORT", "json").lower()
+
+class JsonLinesSpanExporter:
+    """OpenTelemetry span exporter appending one JSON object per finished span"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def export(self, spans):
+        from opentelemetry.sdk.trace.export import SpanExportResult
+        lines = [json.dumps(json.loads(span.to_json())) for span in spans]
+        with self._lock, open(self.path, "a") as f:
+            f.write("\n".join(lines) + "\n")
+        return SpanExportResult.SUCCESS
+
+    def force_flush(self, timeout_millis=30000):
+        return True
+
+    def shutdown(self):
+        pass
+
+def _build_tracer():
+    global _provider
+    mode = trace_export()
+    if mode == "none":
+        return None
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        if mode == "otlp":
+            # Endpoint and headers come from the standard OTEL_EXPORTER_OTLP_* variables
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+            exporter = OTLPSpanExporter()
+        else:
+            exporter = JsonLinesSpanExporter(os.getenv("TRACE_FILE", ".cache/traces/spans.jsonl"))
+    except ImportError:
+        print("⚠️ OpenTelemetry not installed, timing spans without exporting them")
+        return None
+    # A private provider, so crewai's own telemetry setup is left alone
+    _provider = TracerProvider(resource=Resource.create({"service.name": "linkedin_automation"}))
+    _provider.add_span_processor(BatchSpanProcessor(exporter))
+    atexit.register(_provider.shutdown)
+    return _provider.get_tracer("linkedin_automation")
+
+def get_tracer():
+    """OpenTelemetry tracer, or None when exporting is off or unavailable"""
+    global _tracer, _tracer_ready
+    with _lock:
+        if not _tracer_ready:
+            _tracer = _build_tracer()
+            _tracer_ready = True
+    return _tracer
+
+def _attribute(value):
+    return value if isinstance(value, (str, bool, int, float)) else str(value)
+
+def _record(name, seconds, failed):
+    with _lock:
+        entry = _samples.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0, "errors": 0})
+        entry["count"] += 1
+        entry["total"] += seconds
+        entry["max"] = max(entry["max"], seconds)
+        entry["errors"] += failed
+
+@contextmanager
+def span(name, **attributes):
+    """Time a block as a span; yields the OpenTelemetry span or None"""
+    tracer = get_tracer()
+    started = time.monotonic()
+    failed = False
+    try:
+        if tracer is None:
+            yield None
+        else:
+            clean = {key: _attribute(value) for key, value in attributes.items() if value is not None}
+            with tracer.start_as_current_span(name, attributes=clean) as current:
+                yield current
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        _record(name, time.monotonic() - started, failed)
+
+def traced(name):
+    """Decorator form of span()"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def trace_summary():
+    """{span name: {"count", "total", "avg", "max", "errors"}} for this process"""
+    with _lock:
+        samples = {name: dict(entry) for name, entry in _samples.items()}
+    for entry in samples.values():
+        entry["avg"] = entry["total"] / entry["count"]
+    return samples
+
+def print_trace_summary():
+    """Per-span timing table, slowest total first; also flushes exported spans"""
+    summary = trace_summary()
+    if not summary:
+        return
+    print(f"\n🧭 Trace summary")
+    print(f"{'span':<34}{'count':>7}{'total s':>10}{'avg s':>9}{'max s':>9}{'errors':>8}")
+    for name, entry in sorted(summary.items(), key=lambda item: item[1]["total"], reverse=True):
+        print(f"{name:<34}{entry['count']:>7}{entry['total']:>10.2f}{entry['avg']:>9.2f}"
+              f"{entry['max']:>9.2f}{entry['errors']:>8}")
+    if _provider is not None:
+        _provider.force_flush()
@@ -0,0 +1,102 @@
+import os
+import re
+import time
+import random
+from tools.tracing import traced
+
+TYPING_MODES = ("bulk", "chunked", "cadence", "char")
+
+# One round trip: focus the field and insert the whole text, firing the input
+# events the editor listens for. Returns false if the element is not editable.
+BULK_INSERT_JS = """
+const el = arguments[0], text = arguments[1];
+el.focus();
+if (el.isContentEditable) {
+    return document.execCommand('insertText', false, text);
+}
+if ('value' in el) {
+    const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, el.value + text);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    return true;
+}
+return false;
+"""
+
+class TypingReport:
+    """Round trips and wall time spent entering one piece of text"""
+
+    def __init__(self, mode, chars):
+        self.mode = mode
+        self.chars = chars
+        self.round_trips = 0
+        self.seconds = 0.0
+
+    def __str__(self):
+        return f"{self.mode}: {self.chars} chars in {self.round_trips} round trips, {self.seconds:.2f}s"
+
+def typing_mode():
+    """Typing mode from LINKEDIN_TYPING_MODE, defaulting to cadence"""
+    mode = os.getenv("LINKEDIN_TYPING_MODE", "cadence").lower()
+    return mode if mode in TYPING_MODES else "cadence"
+
+def split_chunks(text, words_per_chunk):
+    """Split text into runs of words, keeping the whitespace that follows each word"""
+    tokens = re.findall(r"\S+\s*|\s+", text)
+    return ["".join(tokens[i:i + words_per_chunk]) for i in range(0, len(tokens), words_per_chunk)]
+
+def _send(element, chunk, report):
+    element.send_keys(chunk)
+    report.round_trips += 1
+
+def _type_bulk(element, text, report):
+    driver = element.parent
+    report.round_trips += 1
+    if not driver.execute_script(BULK_INSERT_JS, element, text):
+        _send(element, text, report)
+
+def _type_chunked(element, text, report, min_delay, max_delay, words_per_chunk=8):
+    for chunk in split_chunks(text, words_per_chunk):
+        _send(element, chunk, report)
+        time.sleep(random.uniform(min_delay, max_delay))
+
+def _type_cadence(element, text, report, min_delay, max_delay):
+    # Bursts of a few words with pauses scaled to the burst length, plus a
+    # longer "thinking" pause after sentence ends and line breaks
+    tokens = re.findall(r"\S+\s*|\s+", text)
+    i = 0
+    while i < len(tokens):
+        size = random.randint(2, 5)
+        burst = "".join(tokens[i:i + size])
+        i += size
+        _send(element, burst, report)
+        pause = len(burst) * random.uniform(min_delay, max_delay) * 0.25
+        if burst.rstrip(" ").endswith((".", "!", "?", "\n")):
+            pause += random.uniform(0.3, 0.8)
+        time.sleep(pause)
+
+def _type_char(element, text, report, min_delay, max_delay):
+    for char in text:
+        _send(element, char, report)
+        time.sleep(random.uniform(min_delay, max_delay))
+
+@traced("poster.type")
+def type_text(element, text, mode=None, min_delay=0.05, max_delay=0.15, clear=True):
+    """Enter text into element using the given typing mode and return a TypingReport"""
+    mode = mode or typing_mode()
+    report = TypingReport(mode, len(text))
+    started = time.monotonic()
+    if clear:
+        element.clear()
+        report.round_trips += 1
+    if mode == "bulk":
+        _type_bulk(element, text, report)
+    elif mode == "chunked":
+        _type_chunked(element, text, report, min_delay, max_delay)
+    elif mode == "cadence":
+        _type_cadence(element, text, report, min_delay, max_delay)
+    else:
+        _type_char(element, text, report, min_delay, max_delay)
+    report.seconds = time.monotonic() - started
+    return report
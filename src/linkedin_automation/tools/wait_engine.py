@@ -0,0 +1,139 @@
+import os
+import json
+import time
+import threading
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from tools.tracing import span
+
+# Per-step deadlines in seconds; a step only waits as long as the page needs
+STEP_TIMEOUTS = {
+    "session_restore": 15,
+    "feed_load": 20,
+    "login_redirect": 30,
+    "security_challenge": 300,
+    "composer_open": 15,
+    "publish_confirm": 20,
+}
+
+PUBLISH_TOAST_XPATH = (
+    "//div[contains(@class, 'artdeco-toast-item')]"
+    "[contains(., 'Post successful') or contains(., 'View post') or contains(., 'posted')]"
+)
+
+def document_ready(driver):
+    """DOM finished loading"""
+    return driver.execute_script("return document.readyState;") == "complete"
+
+def element_present(locator):
+    """An element matching (By, value) exists"""
+    def condition(driver):
+        elements = driver.find_elements(*locator)
+        return elements[0] if elements else False
+    return condition
+
+def url_contains(*fragments):
+    """Current URL contains any of the fragments"""
+    def condition(driver):
+        current_url = driver.current_url
+        return any(fragment in current_url for fragment in fragments)
+    return condition
+
+def network_idle(idle_seconds=0.5):
+    """Document is complete and no new resource entries appeared for idle_seconds"""
+    state = {"count": -1, "since": time.monotonic()}
+
+    def condition(driver):
+        ready, count = driver.execute_script(
+            "return [document.readyState, performance.getEntriesByType('resource').length];"
+        )
+        now = time.monotonic()
+        if ready != "complete" or count != state["count"]:
+            state["count"] = count
+            state["since"] = now
+            return False
+        return now - state["since"] >= idle_seconds
+    return condition
+
+def publish_toast():
+    """LinkedIn's 'Post successful' toast is showing"""
+    return element_present((By.XPATH, PUBLISH_TOAST_XPATH))
+
+def any_of(*conditions):
+    """First truthy result among several conditions"""
+    def condition(driver):
+        for check in conditions:
+            try:
+                result = check(driver)
+            except WebDriverException:
+                continue
+            if result:
+                return result
+        return False
+    return condition
+
+class WaitRecorder:
+    """Collects how long every wait step actually took"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {}
+
+    def record(self, step, seconds, timed_out=False):
+        with self._lock:
+            self.samples.setdefault(step, []).append(seconds)
+        log_file = os.getenv("LINKEDIN_WAIT_LOG")
+        if log_file:
+            with open(log_file, "a") as f:
+                f.write(json.dumps({"step": step, "seconds": round(seconds, 3),
+                                    "timed_out": timed_out, "at": time.time()}) + "\n")
+
+    @staticmethod
+    def _percentile(values, pct):
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def summary(self):
+        """{step: {"count", "p50", "p95", "total"}} over everything recorded"""
+        with self._lock:
+            samples = {step: list(values) for step, values in self.samples.items()}
+        return {
+            step: {
+                "count": len(values),
+                "p50": self._percentile(values, 50),
+                "p95": self._percentile(values, 95),
+                "total": sum(values),
+            }
+            for step, values in samples.items()
+        }
+
+    def print_summary(self):
+        for step, stats in self.summary().items():
+            print(f"⏱️ {step}: n={stats['count']} p50={stats['p50']:.2f}s p95={stats['p95']:.2f}s")
+
+wait_stats = WaitRecorder()
+
+def wait_for(driver, condition, step, timeout=None, poll=0.1):
+    """
+    Poll condition until it is truthy and record the time spent under step.
+    Raises TimeoutException once the step's deadline passes.
+    """
+    timeout = STEP_TIMEOUTS.get(step, 30) if timeout is None else timeout
+    started = time.monotonic()
+    with span(f"wait.{step}", timeout=timeout):
+        try:
+            result = WebDriverWait(driver, timeout, poll_frequency=poll).until(condition)
+        except TimeoutException:
+            wait_stats.record(step, time.monotonic() - started, timed_out=True)
+            raise
+    wait_stats.record(step, time.monotonic() - started)
+    return result
+
+def try_wait_for(driver, condition, step, timeout=None, poll=0.1):
+    """Like wait_for but returns False instead of raising on timeout"""
+    try:
+        return wait_for(driver, condition, step, timeout, poll)
+    except TimeoutException:
+        return False
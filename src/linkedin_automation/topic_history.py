@@ -0,0 +1,206 @@
+import os
+import re
+import json
+import time
+import zlib
+import threading
+import numpy as np
+from tools.file_io import atomic_write
+
+NUM_PERM = 128
+MERSENNE_PRIME = (1 << 61) - 1
+# Multipliers stay below 2**31 and base hashes below 2**32, so a*h+b fits in uint64
+_rng = np.random.RandomState(20240901)
+PERM_A = _rng.randint(1, 1 << 31, size=NUM_PERM, dtype=np.uint64)
+PERM_B = _rng.randint(0, 1 << 31, size=NUM_PERM, dtype=np.uint64)
+
+STOP_WORDS = {
+    "the", "and", "for", "with", "that", "this", "from", "your", "you", "are", "how", "what",
+    "why", "can", "will", "its", "into", "about", "more", "new", "use", "using", "reference",
+}
+# Named but too broad to tell one topic from another
+GENERIC_TERMS = {
+    "ai", "ml", "llm", "genai", "gpu", "api", "nlp", "linkedin", "generative", "artificial",
+    "intelligence", "machine", "learning", "deep", "model", "large", "language", "gen",
+}
+KEY_TERMS = 6
+URL_PATTERN = re.compile(r"https?://[^\s)\]>'\"]+")
+HASHTAG_PATTERN = re.compile(r"#(\w+)")
+WORD_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*[A-Za-z0-9+]|[A-Za-z]")
+MARKUP = " \t\n*_#`\"'>-"
+
+def _is_named(word, sentence_start):
+    """Acronyms, CamelCase, versioned names, and capitalized words inside a sentence"""
+    if any(c.isdigit() for c in word) or any(c.isupper() for c in word[1:]):
+        return True
+    return word[0].isupper() and not sentence_start
+
+def _normalize_term(word):
+    term = word.lower().rstrip(".-")
+    # LLMs -> llm, GPUs -> gpu
+    if word[:-1].isupper() and word.endswith("s") and len(word) > 2:
+        term = term[:-1]
+    return term
+
+def key_terms(text, limit=KEY_TERMS):
+    """
+    The named technologies a topic is about: acronyms, product and framework
+    names, and the initials of capitalized phrases (Retrieval-Augmented
+    Generation -> rag), ranked by how often they occur. A passing mention
+    ranks below the subject, and paraphrases keep the same names.
+    """
+    text = URL_PATTERN.sub(" ", text)
+    counts, first_seen, run = {}, {}, []
+
+    def add(term):
+        if len(term) < 2 or term in STOP_WORDS or term in GENERIC_TERMS:
+            return
+        counts[term] = counts.get(term, 0) + 1
+        first_seen.setdefault(term, len(first_seen))
+
+    def close_run():
+        if len(run) >= 2:
+            add("".join(part[0] for word in run for part in word.split("-") if part).lower())
+        run.clear()
+
+    previous_end = 0
+    for match in WORD_PATTERN.finditer(text):
+        word = match.group()
+        gap = text[previous_end:match.start()]
+        before = text[:match.start()].rstrip(MARKUP)
+        sentence_start = not before or before[-1] in ".!?:"
+        previous_end = match.end()
+        if gap.strip(MARKUP):
+            close_run()  # punctuation ends a capitalized phrase
+        # Runs of Title Case words name things; acronyms and plain words end them
+        if word[0].isupper() and not word.isupper() and word.lower() not in STOP_WORDS:
+            run.append(word)
+        else:
+            close_run()
+        if _is_named(word, sentence_start):
+            add(_normalize_term(word))
+    close_run()
+    ranked = sorted(counts, key=lambda term: (-counts[term], first_seen[term]))
+    return ranked[:limit]
+
+def minhash(tokens):
+    """NUM_PERM-wide MinHash signature of a set of tokens"""
+    if not tokens:
+        return np.full(NUM_PERM, MERSENNE_PRIME, dtype=np.uint64)
+    hashes = np.fromiter((zlib.crc32(t.encode()) for t in tokens), dtype=np.uint64, count=len(tokens))
+    permuted = (PERM_A[:, None] * hashes[None, :] + PERM_B[:, None]) % np.uint64(MERSENNE_PRIME)
+    return permuted.min(axis=1)
+
+def normalize_url(url):
+    return url.lower().rstrip("/.").split("#")[0].replace("://www.", "://")
+
+def parse_post(text):
+    """Headline, hashtags and reference URLs of a finished LinkedIn post"""
+    lines = [line.strip().strip("*#").strip() for line in text.splitlines() if line.strip()]
+    return {
+        "headline": lines[0] if lines else "",
+        "hashtags": sorted({tag.lower() for tag in HASHTAG_PATTERN.findall(text)}),
+        "references": sorted({normalize_url(url) for url in URL_PATTERN.findall(text)}),
+    }
+
+class TopicHistory:
+    """
+    Index of what we already posted, with MinHash near-duplicate detection
+    over each topic's key terms. Signatures for every past post sit in one
+    NumPy matrix, so a new topic is compared against the whole history in a
+    single vectorized step.
+    """
+
+    def __init__(self, path=None, threshold=None):
+        self.path = path or os.getenv("POST_HISTORY_FILE", "src/linkedin_automation/tools/data/post_history.json")
+        self.threshold = threshold if threshold is not None else float(os.getenv("TOPIC_DUP_THRESHOLD", "0.5"))
+        self._lock = threading.Lock()
+        self.posts = self._load()
+        terms = [self._terms(post) for post in self.posts]
+        self.signatures = (np.vstack([minhash(t) for t in terms])
+                           if terms else np.empty((0, NUM_PERM), dtype=np.uint64))
+        self.term_counts = np.array([len(t) for t in terms], dtype=float)
+
+    @staticmethod
+    def _terms(post):
+        # Posts recorded before key terms were stored get them from their topic
+        return post.get("key_terms") or key_terms(post.get("topic", ""))
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f).get("posts", [])
+        except (OSError, ValueError):
+            return []
+
+    def _save(self):
+        atomic_write(self.path, json.dumps({"posts": self.posts}, indent=2))
+
+    def similarities(self, topic_text):
+        """
+        Share of the smaller key-term set found in the other, per past post.
+        Estimated from the MinHash Jaccard J as J * (|A| + |B|) / ((1 + J) * min(|A|, |B|)),
+        so a one-line paraphrase naming the same technology still scores high.
+        """
+        terms = key_terms(topic_text)
+        if not terms or not self.posts:
+            return np.zeros(len(self.posts))
+        jaccard = (self.signatures == minhash(terms)[None, :]).mean(axis=1)
+        sizes = self.term_counts + len(terms)
+        smaller = np.maximum(np.minimum(self.term_counts, len(terms)), 1)
+        contained = jaccard * sizes / ((1 + jaccard) * smaller)
+        return np.where(self.term_counts > 0, np.minimum(contained, 1.0), 0.0)
+
+    def find_duplicate(self, topic_text):
+        """(past_post, similarity) of the closest past post over the threshold, or None"""
+        if not self.posts:
+            return None
+        references = {normalize_url(url) for url in URL_PATTERN.findall(topic_text)}
+        similarity = self.similarities(topic_text)
+        best = int(similarity.argmax())
+        if similarity[best] >= self.threshold:
+            return self.posts[best], float(similarity[best])
+        # Same source article means same topic, however it is worded
+        for post in self.posts:
+            if references & set(post.get("references", [])):
+                return post, 1.0
+        return None
+
+    def recent_headlines(self, limit=10):
+        return [post["headline"] for post in self.posts[-limit:] if post.get("headline")]
+
+    def record(self, topic_text, post_text):
+        """Add a published post to the index"""
+        entry = {"topic": topic_text.strip(), "posted_at": time.strftime("%Y-%m-%d"),
+                 "key_terms": key_terms(topic_text), **parse_post(post_text)}
+        entry["references"] = sorted(set(entry["references"]) |
+                                     {normalize_url(url) for url in URL_PATTERN.findall(topic_text)})
+        with self._lock:
+            self.posts.append(entry)
+            self.signatures = np.vstack([self.signatures, minhash(entry["key_terms"])[None, :]])
+            self.term_counts = np.append(self.term_counts, len(entry["key_terms"]))
+            self._save()
+        return entry
+
+_history = None
+
+def get_topic_history():
+    global _history
+    if _history is None:
+        _history = TopicHistory()
+    return _history
+
+def topic_guardrail(output):
+    """
+    crewai task guardrail for find_trends_task: reject a topic we already
+    posted so the agent re-steers before research and image generation run.
+    """
+    match = get_topic_history().find_duplicate(output.raw)
+    if match is None:
+        return True, output
+    post, similarity = match
+    print(f"🔁 Topic matches '{post['headline']}' from {post['posted_at']} ({similarity:.0%}), asking for another")
+    return False, (
+        f"This topic was already posted on {post['posted_at']} as '{post['headline']}'. "
+        f"Choose a different AI/ML topic that is not one of: {'; '.join(get_topic_history().recent_headlines())}."
+    )
@@ -0,0 +1,85 @@
+"""
+Text and image clients carry their own Gemini keys, so crews using different
+keys can run side by side. litellm's mock_response stands in for Gemini: no
+network access or real keys are needed.
+"""
+import os
+import time
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import litellm
+import pytest
+
+import pipeline_crews
+from llm_clients import RateLimitedLLM
+
+@pytest.fixture
+def provider(monkeypatch):
+    """Answers every completion with the API key it was called with"""
+    monkeypatch.setenv("LLM_CACHE_MODE", "off")
+    monkeypatch.setenv("RATE_LIMITS", '{"gemini-2.5-flash": {"rpm": 100000}, '
+                                      '"gemini-2.5-flash-image-preview": {"rpm": 100000}}')
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    original_completion = litellm.completion
+
+    def completion(*args, **kwargs):
+        time.sleep(random.uniform(0, 0.02))  # let the threads interleave
+        kwargs["mock_response"] = f"key={kwargs.get('api_key')}"
+        return original_completion(*args, **kwargs)
+
+    monkeypatch.setattr(litellm, "completion", completion)
+
+@pytest.fixture
+def crew_keys(monkeypatch):
+    """Fresh pipeline_crews clients built from distinct text and image keys"""
+    monkeypatch.setattr(pipeline_crews, "text_key", "text-key")
+    monkeypatch.setattr(pipeline_crews, "image_key", "image-key")
+    for name in ("_llm_text", "_llm_image", "_search_tool"):
+        monkeypatch.setattr(pipeline_crews, name, None)
+
+def call_concurrently(clients, calls_per_client=10):
+    """[(expected key, answer)] of calls spread over a thread pool"""
+    jobs = [(key, i) for i in range(calls_per_client) for key in clients]
+
+    def run(job):
+        key, i = job
+        return key, clients[key].call([{"role": "user", "content": f"ping {i}"}])
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        return list(pool.map(run, jobs))
+
+def test_clients_use_only_their_own_key(provider):
+    environ_before = dict(os.environ)
+    clients = {key: RateLimitedLLM(model="gemini/gemini-2.5-flash", api_key=key)
+               for key in ("text-key", "image-key", "third-key")}
+
+    answers = call_concurrently(clients)
+
+    assert [(key, answer) for key, answer in answers if answer != f"key={key}"] == []
+    assert dict(os.environ) == environ_before
+
+def test_crew_getters_leave_environ_untouched(provider, crew_keys):
+    environ_before = dict(os.environ)
+
+    crews = {name: crew_class().crew() for name, crew_class in pipeline_crews.CREW_CLASSES.items()}
+
+    assert dict(os.environ) == environ_before
+    assert {agent.llm.api_key for agent in crews["content"].agents} == {"text-key"}
+    assert {agent.llm.api_key for agent in crews["posting"].agents} == {"text-key"}
+    assert {agent.llm.api_key for agent in crews["image"].agents} == {"image-key"}
+
+def test_text_and_image_llms_run_concurrently(provider, crew_keys):
+    environ_before = dict(os.environ)
+    clients = {"text-key": pipeline_crews.get_text_llm(), "image-key": pipeline_crews.get_image_llm()}
+
+    answers = call_concurrently(clients)
+
+    assert [(key, answer) for key, answer in answers if answer != f"key={key}"] == []
+    assert dict(os.environ) == environ_before
+
+def test_getters_build_one_client_under_concurrent_first_use(crew_keys):
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(pool.map(lambda _: pipeline_crews.get_text_llm(), range(16)))
+
+    assert len({id(client) for client in clients}) == 1
@@ -0,0 +1,143 @@
+"""
+The Hugging Face client against a local stand-in server: 503 "model loading"
+retries, 429 backoff through the rate limiter, the loading-wait cap and
+cancellation. No network access or real token is needed.
+"""
+import json
+import time
+import uuid
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from tools.hf_image import DEFAULT_HF_MODEL, HFInferenceClient
+from tools.rate_limiter import get_rate_limiter
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\0" * 2048
+
+def loading(estimated_time=1.0):
+    return 503, json.dumps({"error": "loading", "estimated_time": estimated_time}).encode(), "application/json", {}
+
+def image():
+    return 200, PNG, "image/png", {}
+
+def rate_limited(retry_after="0"):
+    return 429, b'{"error": "rate limited"}', "application/json", {"Retry-After": retry_after}
+
+@pytest.fixture
+def stand_in(monkeypatch):
+    """
+    Local server answering each POST with the next queued response; the last
+    one repeats once the queue runs out. Yields the server state.
+    """
+    monkeypatch.setenv("RATE_LIMITS", '{"huggingface": {"rpm": 100000}}')
+    state = {"responses": [], "calls": 0}
+    lock = threading.Lock()
+
+    class StandIn(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            with lock:
+                state["calls"] += 1
+                responses = state["responses"]
+                status, body, kind, headers = responses.pop(0) if len(responses) > 1 else responses[0]
+            self.send_response(status)
+            self.send_header("Content-Type", kind)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    state["url"] = f"http://127.0.0.1:{server.server_port}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+def make_client(stand_in, **kwargs):
+    # A fresh token per test so each one gets its own rate limiter
+    return HFInferenceClient(base_url=stand_in["url"], token=f"test-{uuid.uuid4().hex}", **kwargs)
+
+def test_loading_503_waits_for_estimated_time_then_returns_image(stand_in):
+    stand_in["responses"] = [loading(1.0), image()]
+    client = make_client(stand_in)
+
+    started = time.monotonic()
+    data = client.infer(DEFAULT_HF_MODEL, {"inputs": "a test"})
+
+    assert data == PNG
+    assert time.monotonic() - started >= 1.0
+    metrics = client.metrics()
+    assert metrics["loading_retries"] == 1
+    assert metrics["statuses"] == {503: 1, 200: 1}
+
+def test_429_backs_off_through_the_rate_limiter_and_retries(stand_in):
+    stand_in["responses"] = [rate_limited("0"), image()]
+    client = make_client(stand_in)
+
+    data = client.infer(DEFAULT_HF_MODEL, {"inputs": "a test"})
+
+    assert data == PNG
+    assert client.metrics()["statuses"] == {429: 1, 200: 1}
+    assert client.metrics()["loading_retries"] == 0
+    limiter = get_rate_limiter("huggingface", client.token)
+    assert limiter.factor < 1.0
+    assert limiter.calls == 2
+
+def test_429_honours_retry_after(stand_in):
+    stand_in["responses"] = [rate_limited("1"), image()]
+    client = make_client(stand_in)
+
+    started = time.monotonic()
+    assert client.infer(DEFAULT_HF_MODEL, {"inputs": "a test"}) == PNG
+    assert time.monotonic() - started >= 1.0
+
+def test_gives_up_once_max_loading_wait_expires(stand_in):
+    stand_in["responses"] = [loading(5.0)]
+    client = make_client(stand_in, max_loading_wait=1)
+
+    started = time.monotonic()
+    with pytest.raises(RuntimeError, match="Hugging Face returned 503"):
+        client.infer(DEFAULT_HF_MODEL, {"inputs": "a test"})
+
+    # Waits out the remaining budget, not the server's 5s estimate
+    assert time.monotonic() - started < 4.0
+    assert client.metrics()["loading_retries"] == 1
+    assert stand_in["calls"] == 2
+
+def test_non_loading_error_raises_without_retrying(stand_in):
+    stand_in["responses"] = [(500, b"boom", "text/plain", {})]
+    client = make_client(stand_in)
+
+    with pytest.raises(RuntimeError, match="Hugging Face returned 500: boom"):
+        client.infer(DEFAULT_HF_MODEL, {"inputs": "a test"})
+    assert stand_in["calls"] == 1
+
+def test_cancel_event_set_beforehand_sends_nothing(stand_in):
+    stand_in["responses"] = [image()]
+    client = make_client(stand_in)
+    cancel = threading.Event()
+    cancel.set()
+
+    with pytest.raises(RuntimeError, match="Cancelled before"):
+        client.infer(DEFAULT_HF_MODEL, {"inputs": "a test"}, cancel_event=cancel)
+    assert stand_in["calls"] == 0
+
+def test_cancel_event_stops_the_loading_wait(stand_in):
+    stand_in["responses"] = [loading(30.0)]
+    client = make_client(stand_in)
+    cancel = threading.Event()
+    threading.Timer(0.2, cancel.set).start()
+
+    started = time.monotonic()
+    with pytest.raises(RuntimeError, match="Cancelled while the model was loading"):
+        client.infer(DEFAULT_HF_MODEL, {"inputs": "a test"}, cancel_event=cancel)
+
+    assert time.monotonic() - started < 5.0
+    assert stand_in["calls"] == 1
@@ -0,0 +1,52 @@
+"""Near-duplicate topic detection on key terms, run right after trend selection"""
+import pytest
+
+from topic_history import TopicHistory, key_terms
+
+RAG_TOPIC = (
+    "**Retrieval-Augmented Generation (RAG)** lets large language models answer from your own "
+    "documents. RAG pipelines retrieve relevant chunks from a vector store such as Pinecone or FAISS "
+    "and pass them to the LLM as context. Frameworks like LangChain and LlamaIndex make RAG easy to "
+    "build. Reference: https://example.com/rag-guide"
+)
+
+@pytest.fixture
+def history(tmp_path):
+    history = TopicHistory(str(tmp_path / "post_history.json"))
+    history.record(RAG_TOPIC, "RAG in five minutes\nHow retrieval grounds LLM answers. #RAG")
+    return history
+
+def test_key_terms_rank_the_subject_first():
+    terms = key_terms(RAG_TOPIC)
+    assert terms[0] == "rag"
+    assert {"pinecone", "langchain"} <= set(terms)
+    assert not {"llm", "the", "reference"} & set(terms)
+
+def test_long_form_and_acronym_give_the_same_term():
+    assert "rag" in key_terms("A primer on Retrieval Augmented Generation for support bots.")
+
+@pytest.mark.parametrize("paraphrase", [
+    "Grounding LLM answers in company documents with retrieval-augmented generation (RAG).",
+    "Topic: RAG - let your chatbot cite internal docs instead of guessing.",
+    "Retrieval Augmented Generation explained for engineers.",
+])
+def test_paraphrase_of_a_posted_topic_is_a_duplicate(history, paraphrase):
+    match = history.find_duplicate(paraphrase)
+    assert match is not None
+    assert match[0]["headline"] == "RAG in five minutes"
+
+@pytest.mark.parametrize("topic", [
+    "LoRA fine-tuning lets you adapt Llama 3 to a new domain on a single GPU using Hugging Face PEFT.",
+    "Topic: Multi-agent orchestration with CrewAI and AutoGen. Agent frameworks such as CrewAI let "
+    "several LLM agents split a task; AutoGen adds conversation patterns.",
+    "Quantizing models to 4-bit with GGUF and llama.cpp to run them on a laptop CPU.",
+])
+def test_different_topic_is_not_a_duplicate(history, topic):
+    assert history.find_duplicate(topic) is None
+
+def test_shared_reference_is_a_duplicate_whatever_the_wording(history):
+    assert history.find_duplicate("Something else entirely, see https://www.example.com/rag-guide/") is not None
+
+def test_history_survives_a_reload(history):
+    reloaded = TopicHistory(history.path)
+    assert reloaded.find_duplicate("Topic: RAG for internal search.") is not None